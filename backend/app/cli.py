@@ -0,0 +1,177 @@
+# backend/app/cli.py
+"""
+Maintenance commands, run next to the API:
+
+    python -m app.cli reconcile [--fix] [--full] [--batch-size N]
+    python -m app.cli rebuild-rollups [--user ID]
+    python -m app.cli rebuild-goals [--user ID]
+    python -m app.cli bench-hashing [--logins N] [--inline]
+    python -m app.cli bench-dashboard --user ID [--requests N]
+        [--concurrency N]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Optional
+
+from app.core.security import pwd_ctx, verify_password
+from app.db import DB_MAX_OVERFLOW, DB_POOL_SIZE, async_session, engine
+from app.routers.dashboard import load_dashboard_parts
+from app.services.goals import rebuild_goal_totals
+from app.services.reconcile import reconcile_balances
+from app.services.rollups import rebuild_rollups
+
+
+# ── Commands ──────────────────────────────────────────────
+async def _reconcile(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        report = await reconcile_balances(
+            session, fix=args.fix, full=args.full, batch_size=args.batch_size
+        )
+    mode = "full" if report.full else "incremental"
+    print(f"Checked {report.checked} accounts ({mode} run)")
+    for d in report.drifted:
+        print(
+            f"  account {d.account_id} (user {d.user_id}): "
+            f"stored={d.stored:.2f} expected={d.expected:.2f} "
+            f"drift={d.drift:+.2f}"
+        )
+    if args.fix:
+        print(f"Fixed {report.fixed} accounts")
+    return 1 if report.drifted and not args.fix else 0
+
+
+async def _rebuild_rollups(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        buckets = await rebuild_rollups(session, user_id=args.user)
+    print(f"Rebuilt {buckets} monthly rollup rows")
+    return 0
+
+
+async def _rebuild_goals(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        goals = await rebuild_goal_totals(session, user_id=args.user)
+    print(f"Rebuilt deposit totals for {goals} goals")
+    return 0
+
+
+async def _bench_hashing(args: argparse.Namespace) -> int:
+    """
+    Fire a storm of concurrent password checks and measure how late a
+    10 ms ticker wakes up meanwhile, i.e. event-loop stall per request.
+    """
+    stored = pwd_ctx.hash("correct horse battery staple")
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    async def login() -> None:
+        if args.inline:
+            pwd_ctx.verify("wrong password", stored)
+        else:
+            await verify_password("wrong password", stored)
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(args.logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+    mode = "inline" if args.inline else "thread pool"
+    print(f"{args.logins} logins ({mode}) in {elapsed:.2f}s")
+    print(f"  loop lag p99={p99 * 1000:.1f}ms max={max(lags or [0]) * 1000:.1f}ms")
+    return 0
+
+
+async def _bench_dashboard(args: argparse.Namespace) -> int:
+    """
+    Time the dashboard's five reads for one user, `concurrency` requests
+    at a time, each on its own pooled connection.
+    """
+    latencies: List[float] = []
+    gate = asyncio.Semaphore(args.concurrency)
+
+    async def one() -> None:
+        async with gate:
+            start = time.perf_counter()
+            await load_dashboard_parts(args.user, 5, 5)
+            latencies.append(time.perf_counter() - start)
+
+    await load_dashboard_parts(args.user, 5, 5)  # warm the pool
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)]
+
+    print(
+        f"{args.requests} dashboards (concurrency {args.concurrency}, "
+        f"pool {DB_POOL_SIZE}+{DB_MAX_OVERFLOW}) in {elapsed:.2f}s"
+    )
+    print(
+        f"  p50={pct(0.5) * 1000:.1f}ms p95={pct(0.95) * 1000:.1f}ms "
+        f"p99={pct(0.99) * 1000:.1f}ms"
+    )
+    return 0
+
+
+# ── Argument parsing ──────────────────────────────────────
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("reconcile", help="Recompute account balances")
+    rec.add_argument("--fix", action="store_true", help="Overwrite drifted balances")
+    rec.add_argument("--full", action="store_true", help="Ignore the high-water mark")
+    rec.add_argument("--batch-size", type=int, default=500)
+    rec.set_defaults(func=_reconcile)
+
+    roll = sub.add_parser("rebuild-rollups", help="Backfill monthly_rollup")
+    roll.add_argument("--user", type=int, default=None, help="Only this user")
+    roll.set_defaults(func=_rebuild_rollups)
+
+    goals = sub.add_parser("rebuild-goals", help="Recompute goal deposit totals")
+    goals.add_argument("--user", type=int, default=None, help="Only this user")
+    goals.set_defaults(func=_rebuild_goals)
+
+    bench = sub.add_parser("bench-hashing", help="Event-loop lag in a login storm")
+    bench.add_argument("--logins", type=int, default=50)
+    bench.add_argument(
+        "--inline", action="store_true", help="Hash on the loop, as before"
+    )
+    bench.set_defaults(func=_bench_hashing)
+
+    dash = sub.add_parser("bench-dashboard", help="Latency of the dashboard reads")
+    dash.add_argument("--user", type=int, required=True, help="User to load")
+    dash.add_argument("--requests", type=int, default=200)
+    dash.add_argument("--concurrency", type=int, default=1)
+    dash.set_defaults(func=_bench_dashboard)
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> int:
+    try:
+        return await args.func(args)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,3 +10,33 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_DURATION"))
+
+# 3) Read cache (memory | redis | none)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_URL = os.getenv("CACHE_URL", "redis://localhost:6379/0")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+
+# 4) Authenticated principal cache
+# Invalidation markers live in CACHE_BACKEND; with several workers use redis
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+# 5) Password hashing (bcrypt cost factor and worker threads)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", "4"))
+
+# 6) Rate limiting: "group=capacity/seconds,..." token buckets
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMITS = os.getenv("RATE_LIMITS", "auth=10/60,transactions=120/60,default=300/60")
+
+# 7) Scheduler lease, held for the length of one run (renewed while it lasts)
+SCHEDULER_LEASE_SECONDS = int(os.getenv("SCHEDULER_LEASE_SECONDS", "300"))
+# Full reload of the recurring timer, to pick up edits made on other workers
+SCHEDULER_RESYNC_SECONDS = int(os.getenv("SCHEDULER_RESYNC_SECONDS", "300"))
+
+# 8) Reconciliation: rescan writes stamped this long before the previous
+# run started, so ones still uncommitted when it read are not skipped
+RECONCILE_HIGH_WATER_MARGIN_SECONDS = int(
+    os.getenv("RECONCILE_HIGH_WATER_MARGIN_SECONDS", "900")
+)
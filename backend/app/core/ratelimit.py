@@ -0,0 +1,174 @@
+# backend/app/core/ratelimit.py
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from jose import JWTError, jwt
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.config import (
+    ALGORITHM,
+    CACHE_URL,
+    RATE_LIMIT_BACKEND,
+    RATE_LIMITS,
+    SECRET_KEY,
+)
+
+# ── Route groups: first matching path prefix wins ─────────
+ROUTE_GROUPS = [
+    ("/auth", "auth"),
+    ("/transactions", "transactions"),
+]
+EXEMPT_PATHS = {"/health", "/docs", "/openapi.json"}
+
+
+@dataclass(frozen=True)
+class Bucket:
+    capacity: int
+    refill_per_sec: float
+
+
+def parse_limits(spec: str) -> Dict[str, Bucket]:
+    """Parse "auth=10/60,default=300/60" into buckets per group."""
+    limits: Dict[str, Bucket] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        group, rule = part.split("=", 1)
+        capacity, seconds = rule.split("/", 1)
+        limits[group.strip()] = Bucket(int(capacity), int(capacity) / float(seconds))
+    return limits
+
+
+# ── Backends: take one token, return seconds to wait ──────
+class MemoryBuckets:
+    """Per-process buckets, LRU-bounded so idle clients are dropped."""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._state: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, bucket: Bucket) -> float:
+        now = time.monotonic()
+        tokens, last = self._state.get(key, (bucket.capacity, now))
+        tokens = min(bucket.capacity, tokens + (now - last) * bucket.refill_per_sec)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / bucket.refill_per_sec
+        self._state[key] = (tokens, now)
+        self._state.move_to_end(key)
+        while len(self._state) > self.max_keys:
+            self._state.popitem(last=False)
+        return wait
+
+
+# Refill and take in one atomic step on the Redis side
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBuckets:
+    """Buckets shared by all workers (needs `redis`)."""
+
+    def __init__(self, url: str = CACHE_URL) -> None:
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        self._client = aioredis.from_url(url, decode_responses=True)
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, bucket: Bucket) -> float:
+        wait = await self._take(
+            keys=[f"tv:rl:{key}"],
+            args=[bucket.capacity, bucket.refill_per_sec, time.time()],
+        )
+        return float(wait)
+
+
+# ── Limiter ───────────────────────────────────────────────
+class RateLimiter:
+    def __init__(self, limits: Dict[str, Bucket], backend) -> None:
+        self.limits = limits
+        self.backend = backend
+        self.allowed: Dict[str, int] = {}
+        self.throttled: Dict[str, int] = {}
+
+    @staticmethod
+    def group_for(path: str) -> str:
+        for prefix, group in ROUTE_GROUPS:
+            if path == prefix or path.startswith(prefix + "/"):
+                return group
+        return "default"
+
+    @staticmethod
+    def client_key(request: Request) -> str:
+        # Authenticated callers get their own bucket, others share by IP
+        auth = request.headers.get("authorization", "")
+        if auth.lower().startswith("bearer "):
+            try:
+                payload = jwt.decode(auth[7:], SECRET_KEY, algorithms=[ALGORITHM])
+                if payload.get("sub"):
+                    return f"user:{payload['sub']}"
+            except JWTError:
+                pass
+        return f"ip:{request.client.host if request.client else 'unknown'}"
+
+    async def check(self, request: Request) -> Optional[float]:
+        """Return seconds to wait when throttled, None when allowed."""
+        group = self.group_for(request.url.path)
+        bucket = self.limits.get(group) or self.limits.get("default")
+        if bucket is None:
+            return None
+        wait = await self.backend.take(f"{group}:{self.client_key(request)}", bucket)
+        counter = self.throttled if wait > 0 else self.allowed
+        counter[group] = counter.get(group, 0) + 1
+        return wait if wait > 0 else None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"allowed": dict(self.allowed), "throttled": dict(self.throttled)}
+
+
+def build_limiter() -> Optional[RateLimiter]:
+    if RATE_LIMIT_BACKEND == "none":
+        return None
+    backend = RedisBuckets() if RATE_LIMIT_BACKEND == "redis" else MemoryBuckets()
+    return RateLimiter(parse_limits(RATE_LIMITS), backend)
+
+
+rate_limiter = build_limiter()
+
+
+# ── Middleware ────────────────────────────────────────────
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if (
+            rate_limiter is None
+            or request.method == "OPTIONS"
+            or request.url.path in EXEMPT_PATHS
+        ):
+            return await call_next(request)
+        wait = await rate_limiter.check(request)
+        if wait is not None:
+            return JSONResponse(
+                {"detail": "Too many requests"},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+        return await call_next(request)
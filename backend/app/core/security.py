@@ -1,7 +1,13 @@
 # backend/app/core/security.py
 
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Tuple
+from uuid import uuid4
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -9,22 +15,50 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
-from app.db import get_session
+from app.core.config import (
+    SECRET_KEY,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    AUTH_CACHE_MAX_ENTRIES,
+    AUTH_CACHE_TTL_SECONDS,
+    BCRYPT_ROUNDS,
+    HASH_POOL_WORKERS,
+)
+from app.db import get_session, read_session
 from app.models import User
+from app.services.cache import CacheBackend, read_cache
 
 # ─── Password hashing ────────────────────────────────────────────────────────
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the
+# event loop while capping how many cores a login burst can take.
+pwd_ctx = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS
+)
+hash_pool = ThreadPoolExecutor(
+    max_workers=HASH_POOL_WORKERS, thread_name_prefix="bcrypt"
+)
 
 
-def hash_password(password: str) -> str:
+async def _in_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(hash_pool, fn, *args)
+
+
+async def hash_password(password: str) -> str:
     """Hash a plaintext password."""
-    return pwd_ctx.hash(password)
+    return await _in_pool(pwd_ctx.hash, password)
 
 
-def verify_password(plain: str, hashed: str) -> bool:
+async def verify_password(plain: str, hashed: str) -> bool:
     """Verify a plaintext password against its hash."""
-    return pwd_ctx.verify(plain, hashed)
+    return await _in_pool(pwd_ctx.verify, plain, hashed)
+
+
+async def verify_and_rehash(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, when the stored hash uses a different cost
+    factor than BCRYPT_ROUNDS, also return a fresh hash to persist.
+    """
+    return await _in_pool(pwd_ctx.verify_and_update, plain, hashed)
 
 
 # ─── Token creation ──────────────────────────────────────────────────────────
@@ -39,6 +73,77 @@ def create_access_token(data: Dict[str, Any]) -> str:
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+# ─── Principal cache: verified token → lightweight user ────────────────
+@dataclass(frozen=True)
+class Principal:
+    user_id: int
+    email: str
+    name: str
+
+
+class PrincipalCache:
+    """
+    Bounded LRU of verified tokens. Entries live for `ttl` seconds but
+    never past the token's own `exp`. Each entry remembers the user's
+    marker in the shared `backend` at the time it was cached; a profile
+    change or deletion replaces the marker, so every worker sharing the
+    backend drops that user's entries on their next use.
+    """
+
+    def __init__(self, max_entries: int, ttl: int, backend: CacheBackend) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.backend = backend
+        self._data: "OrderedDict[str, Tuple[float, Optional[str], Principal]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _marker_key(user_id: int) -> str:
+        return f"tv:principal:{user_id}"
+
+    async def marker(self, user_id: int) -> Optional[str]:
+        return await self.backend.get(self._marker_key(user_id))
+
+    async def get(self, token: str) -> Optional[Principal]:
+        item = self._data.get(token)
+        if item is None:
+            return None
+        expires, marker, principal = item
+        if expires < time.time() or await self.marker(principal.user_id) != marker:
+            self._data.pop(token, None)
+            return None
+        if token in self._data:
+            self._data.move_to_end(token)
+        return principal
+
+    def put(
+        self,
+        token: str,
+        principal: Principal,
+        token_exp: float,
+        marker: Optional[str] = None,
+    ) -> None:
+        """Cache `principal` under the `marker` read before it was loaded."""
+        expires = min(time.time() + self.ttl, token_exp)
+        self._data[token] = (expires, marker, principal)
+        self._data.move_to_end(token)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def invalidate_user(self, user_id: int) -> None:
+        stale = [t for t, (_, _, p) in self._data.items() if p.user_id == user_id]
+        for token in stale:
+            del self._data[token]
+        # Outlives every entry cached before it, which is all it must reach
+        await self.backend.set(self._marker_key(user_id), uuid4().hex, self.ttl + 1)
+
+
+principal_cache = PrincipalCache(
+    AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS, read_cache.backend
+)
+
+
 # ─── Dependency: extract current user from Bearer token ────────────────
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
@@ -46,10 +151,15 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session),
-) -> User:
+) -> Principal:
     """
-    Decode the JWT, load the User from the database, or raise 401.
+    Decode the JWT and resolve its principal, from the cache when
+    possible and from the database otherwise, or raise 401.
     """
+    principal = await principal_cache.get(token)
+    if principal:
+        return principal
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -60,10 +170,23 @@ async def get_current_user(
         user_id: str = payload.get("sub")
         if not user_id:
             raise credentials_exception
-    except JWTError:
+        user_id = int(user_id)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = await session.get(User, int(user_id))
+    # Read before the user row, so a change in between is never cached
+    marker = await principal_cache.marker(user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise credentials_exception
-    return user
+    principal = Principal(user_id=user.user_id, email=user.email, name=user.name)
+    principal_cache.put(token, principal, payload.get("exp", float("inf")), marker)
+    return principal
+
+
+# ─── Dependency: read-only session for the current user ────────────────
+async def get_read_session(
+    current: Principal = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with read_session(current.user_id) as session:
+        yield session
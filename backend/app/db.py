@@ -5,18 +5,112 @@ from dotenv import load_dotenv
 
 load_dotenv()  # ensure .env is loaded before os.getenv() call
 
+import math
 import os
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List
+from uuid import uuid4
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import sessionmaker
+from app.services.cache import CacheBackend, MemoryBackend, NullBackend, read_cache
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-print("Using DB URL:", DATABASE_URL)
+# Optional read replica; unset means every read goes to the primary
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+# Seconds a user's reads stay on the primary after they write
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+# Seconds to skip the replica after it failed to connect
+REPLICA_RETRY_SECONDS = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+
+# ── Engine settings (env) ─────────────────────────────────
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# Prepared-statement caches (asyncpg's and SQLAlchemy's); set 0 behind
+# pgbouncer in transaction mode, which also switches to unique statement names
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+# Checkout latency histogram bucket bounds, in seconds
+CHECKOUT_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0]
+
+
+# ── Pool with checkout metrics ────────────────────────────
+class MeteredPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that counts callers waiting for a connection and records
+    how long each checkout took, for sizing the pool against load.
+    """
+
+    def __init__(self, *args: Any, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.waiting = 0
+        self.checkouts = 0
+        self.checkout_seconds = 0.0
+        self.histogram = [0] * (len(CHECKOUT_BUCKETS) + 1)
+
+    def _do_get(self):
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.waiting -= 1
+            self.checkouts += 1
+            self.checkout_seconds += elapsed
+            self.histogram[bisect_left(CHECKOUT_BUCKETS, elapsed)] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        bounds: List[str] = [str(b) for b in CHECKOUT_BUCKETS] + ["+Inf"]
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "waiting": self.waiting,
+            "checkouts": self.checkouts,
+            "checkout_seconds_total": round(self.checkout_seconds, 6),
+            "checkout_latency": dict(zip(bounds, self.histogram)),
+        }
+
 
 # ── Engine & session factory ──────────────────────────────
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def make_engine(url: str) -> AsyncEngine:
+    connect_args: Dict[str, Any] = {}
+    if url and "+asyncpg" in url:
+        connect_args["statement_cache_size"] = DB_STATEMENT_CACHE_SIZE
+        connect_args["prepared_statement_cache_size"] = DB_STATEMENT_CACHE_SIZE
+        if DB_STATEMENT_CACHE_SIZE == 0:
+            # A pooled server connection may already hold a statement
+            # another client prepared under the same sequential name
+            connect_args["prepared_statement_name_func"] = _unique_statement_name
+    return create_async_engine(
+        url,
+        echo=DB_ECHO,
+        future=True,
+        poolclass=MeteredPool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+engine = make_engine(DATABASE_URL)
 
 async_session = sessionmaker(
     bind=engine,
@@ -25,6 +119,74 @@ async_session = sessionmaker(
 )
 
 
+replica_engine = make_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
+
+replica_session = sessionmaker(
+    bind=replica_engine or engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def pool_stats() -> Dict[str, Any]:
+    stats = {"primary": engine.pool.stats()}
+    if replica_engine is not None:
+        stats["replica"] = replica_engine.pool.stats()
+    return stats
+
+
+# ── Replica routing ───────────────────────────────────────
+# Last-write markers live in the cache backend so every worker sees them
+# (with CACHE_BACKEND=redis); the memory fallback only pins per worker
+_write_marks: CacheBackend = (
+    MemoryBackend()
+    if isinstance(read_cache.backend, NullBackend)
+    else read_cache.backend
+)
+_replica_down_until = 0.0
+
+
+def _write_mark_key(user_id: int) -> str:
+    return f"tv:wrote:{user_id}"
+
+
+async def note_write(user_id: int) -> None:
+    """Pin `user_id`'s reads to the primary for a short window."""
+    if replica_engine is None:
+        return
+    ttl = max(1, math.ceil(READ_YOUR_WRITES_SECONDS))
+    await _write_marks.set(_write_mark_key(user_id), "1", ttl)
+
+
+async def _use_replica(user_id: int) -> bool:
+    if replica_engine is None or time.monotonic() < _replica_down_until:
+        return False
+    return await _write_marks.get(_write_mark_key(user_id)) is None
+
+
+@asynccontextmanager
+async def read_session(user_id: int) -> AsyncIterator[AsyncSession]:
+    """
+    Session for read-only work: the replica unless the user wrote within
+    READ_YOUR_WRITES_SECONDS or the replica is unreachable, in which
+    case the primary.
+    """
+    global _replica_down_until
+    if await _use_replica(user_id):
+        session = replica_session()
+        try:
+            await session.connection()
+        except (DBAPIError, OSError):
+            await session.close()
+            _replica_down_until = time.monotonic() + REPLICA_RETRY_SECONDS
+        else:
+            async with session:
+                yield session
+            return
+    async with async_session() as session:
+        yield session
+
+
 # ── DB session dependency ─────────────────────────────────
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
@@ -2,12 +2,14 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import text
 from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from datetime import datetime, timedelta
-from app.db import engine, get_session
-from app.models import RecurringTransaction, Transaction
+from app.core.ratelimit import RateLimitMiddleware, rate_limiter
+from app.db import engine, get_session, pool_stats
+from app.services.cache import read_cache
+from app.services.recurring import JOB_NAME as RECURRING_JOB_NAME, recurring_timer
+from app.services.scheduler import SchedulerStatus, scheduler_status
 
 # ── Routers ─────────────────────────────────────────────
 from app.routers import auth, users, accounts, transactions
@@ -15,10 +17,15 @@ from app.routers.budgets import router as budgets_router
 from app.routers.recurring import router as recurring_router
 from app.routers.goals import router as goals_router
 from app.routers.calculators import router as calculators_router
+from app.routers.summary import router as summary_router
+from app.routers.dashboard import router as dashboard_router
 
 # ── App setup ─────────────────────────────────────────────
 app = FastAPI(title="TrackVault API")
 
+# ── Rate limiting (added first so CORS wraps 429s too) ──────
+app.add_middleware(RateLimitMiddleware)
+
 # ── CORS middleware ───────────────────────────────────────
 app.add_middleware(
     CORSMiddleware,
@@ -26,17 +33,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Retry-After"],
 )
 
 
-# ── Startup: create tables & schedule recurring ──────
+# ── Startup: create tables & start the recurring timer ──
 @app.on_event("startup")
 async def on_startup():
     async with engine.begin() as conn:
+        # trigram index on transaction.title needs the extension first
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(SQLModel.metadata.create_all)
-    sched = AsyncIOScheduler()
-    sched.add_job(run_recurring, trigger="cron", hour=0, minute=0)
-    sched.start()
+    # Every worker keeps the timer; the lease lets one run generate at a time
+    recurring_timer.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await recurring_timer.stop()
 
 
 # ── Routers ───────────────────────────────────────
@@ -48,51 +62,24 @@ app.include_router(budgets_router, prefix="/budgets", tags=["budgets"])
 app.include_router(recurring_router, prefix="/recurring", tags=["recurring"])
 app.include_router(goals_router, prefix="/goals", tags=["goals"])
 app.include_router(calculators_router, prefix="/calculators", tags=["calculators"])
+app.include_router(summary_router, prefix="/summary", tags=["summary"])
+app.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
 
 
 # ── Health checkpoint ─────────────────────────────────
 @app.get("/health")
 async def health(session: AsyncSession = Depends(get_session)):
     ok = await session.scalar(select(1))
-    return {"status": "ok", "db": ok}
-
-
-# ── Process due recurring transactions ────────────────
-async def run_recurring():
-    async with get_session() as session:
-        now = datetime.utcnow()
-        recs = (
-            await session.exec(
-                select(RecurringTransaction).where(
-                    RecurringTransaction.next_run_date <= now
-                )
-            )
-        ).all()
-
-        for rec in recs:
-            tx = Transaction(
-                user_id=rec.user_id,
-                account_id=rec.account_id,
-                amount=rec.amount,
-                date=rec.next_run_date,
-                description=f"Recurring ({rec.frequency})",
-                type="expense",
-            )
-            session.add(tx)
+    return {
+        "status": "ok",
+        "db": ok,
+        "pool": pool_stats(),
+        "cache": read_cache.stats(),
+        "rate_limit": rate_limiter.stats() if rate_limiter else None,
+    }
 
-            # ── Bump next_run_date ──────────────────────────
-            if rec.frequency == "daily":
-                rec.next_run_date += timedelta(days=1)
-            elif rec.frequency == "weekly":
-                rec.next_run_date += timedelta(weeks=1)
-            elif rec.frequency == "monthly":
-                m = rec.next_run_date.month % 12 + 1
-                y = rec.next_run_date.year + (1 if m == 1 else 0)
-                rec.next_run_date = rec.next_run_date.replace(year=y, month=m)
-            else:
-                rec.next_run_date = rec.next_run_date.replace(
-                    year=rec.next_run_date.year + 1
-                )
-            rec.updated_at = now
 
-        await session.commit()
+# ── Recurring scheduler status ────────────────────────
+@app.get("/scheduler/status", response_model=SchedulerStatus)
+async def recurring_scheduler_status(session: AsyncSession = Depends(get_session)):
+    return await scheduler_status(session, RECURRING_JOB_NAME)
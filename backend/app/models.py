@@ -2,8 +2,8 @@
 from datetime import datetime
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column
-from sqlalchemy.dialects.postgresql import ENUM as PGEnum
+from sqlalchemy import Column, Computed, Index, text
+from sqlalchemy.dialects.postgresql import ENUM as PGEnum, TSVECTOR
 import enum
 
 
@@ -72,6 +72,9 @@ class Account(SQLModel, table=True):
         ),
     )
     balance: float = Field(default=0.0)
+    opening_balance: float = Field(
+        default=0.0, description="Balance not explained by the ledger"
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -81,8 +84,52 @@ class Account(SQLModel, table=True):
 
 
 # ── Transaction model ──────────────────────────────────────
+TRANSACTION_SEARCH_DOCUMENT = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+
+
 class Transaction(SQLModel, table=True):
     __tablename__ = "transaction"
+    __table_args__ = (
+        # ── Full-text search: generated tsvector, never mapped ──
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(TRANSACTION_SEARCH_DOCUMENT, persisted=True),
+        ),
+        Index("ix_transaction_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_transaction_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        # ── Hot-path indexes (see migrations/versions/0001) ──
+        Index(
+            "ix_transaction_user_date_id",
+            "user_id",
+            text("date DESC"),
+            text("transaction_id DESC"),
+        ),
+        Index(
+            "ix_transaction_user_account_date",
+            "user_id",
+            "account_id",
+            text("date DESC"),
+        ),
+        Index("ix_transaction_budget_date", "budget_id", "date"),
+        # ── Incremental reconcile: rows touched since the mark ──
+        Index("ix_transaction_updated_at", "updated_at"),
+        # ── One transaction per recurring occurrence (idempotent runs) ──
+        Index(
+            "ux_transaction_recurring_occurrence",
+            "recurring_id",
+            "occurrence_date",
+            unique=True,
+        ),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     transaction_id: int = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.user_id", index=True)
@@ -91,6 +138,16 @@ class Transaction(SQLModel, table=True):
     amount: float = Field(..., description="Positive amount")
     date: datetime = Field(default_factory=datetime.utcnow)
     account_id: int = Field(foreign_key="account.account_id", index=True)
+    budget_id: Optional[int] = Field(
+        default=None, foreign_key="budget.budget_id", ondelete="SET NULL"
+    )
+    # Set on rows generated from a recurring rule
+    recurring_id: Optional[int] = Field(
+        default=None,
+        foreign_key="recurring_transaction.recurring_id",
+        ondelete="SET NULL",
+    )
+    occurrence_date: Optional[datetime] = None
     direction: TransactionDirection = Field(
         sa_column=Column(
             "direction",
@@ -124,6 +181,17 @@ class Budget(SQLModel, table=True):
     section: Section = Field(sa_column=Column(PGEnum(Section), nullable=False))
     label: str
     amount: float
+    period: BudgetPeriod = Field(
+        default=BudgetPeriod.monthly,
+        sa_column=Column(
+            "period",
+            PGEnum(BudgetPeriod, name="budget_period", create_type=False),
+            nullable=False,
+            server_default="monthly",
+        ),
+    )
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -133,6 +201,14 @@ class Budget(SQLModel, table=True):
 # ── RecurringTransaction model ────────────────────────────
 class RecurringTransaction(SQLModel, table=True):
     __tablename__ = "recurring_transaction"
+    __table_args__ = (
+        # ── Scheduler scan: only rules that can still fire ──
+        Index(
+            "ix_recurring_transaction_active_next_run",
+            "next_run_date",
+            postgresql_where=text("end_date IS NULL OR next_run_date <= end_date"),
+        ),
+    )
 
     recurring_id: int = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.user_id", index=True)
@@ -183,6 +259,10 @@ class Goal(SQLModel, table=True):
             server_default="med",
         )
     )
+    # ── Deposit totals, maintained by every deposit write ──
+    current_amount: float = Field(default=0.0, sa_column_kwargs={"server_default": "0"})
+    deposit_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    last_deposit_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -193,6 +273,10 @@ class Goal(SQLModel, table=True):
 # ── Deposit models ──────────────────────────────────
 class GoalDeposit(SQLModel, table=True):
     __tablename__ = "goal_deposit"
+    __table_args__ = (
+        # ── Deposit history keyset: (goal, date, id) ─────
+        Index("ix_goal_deposit_goal_date_id", "goal_id", "date", "deposit_id"),
+    )
 
     deposit_id: int = Field(default=None, primary_key=True)
     goal_id: int = Field(foreign_key="goal.goal_id", index=True)
@@ -201,3 +285,61 @@ class GoalDeposit(SQLModel, table=True):
     note: Optional[str] = None
 
     goal: Goal = Relationship(back_populates="deposits")
+
+
+# ── Reconciliation high-water mark ──────────────────
+class ReconcileState(SQLModel, table=True):
+    __tablename__ = "reconcile_state"
+
+    job: str = Field(primary_key=True)
+    high_water: datetime
+    last_transaction_id: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# ── Monthly rollup (per user / account / month / direction) ──
+class MonthlyRollup(SQLModel, table=True):
+    __tablename__ = "monthly_rollup"
+
+    user_id: int = Field(
+        foreign_key="user.user_id", primary_key=True, ondelete="CASCADE"
+    )
+    account_id: int = Field(
+        foreign_key="account.account_id", primary_key=True, ondelete="CASCADE"
+    )
+    year_month: str = Field(primary_key=True, description="YYYY-MM")
+    direction: TransactionDirection = Field(
+        sa_column=Column(
+            "direction",
+            PGEnum(
+                TransactionDirection, name="transaction_direction", create_type=False
+            ),
+            primary_key=True,
+        )
+    )
+    total: float = Field(default=0.0)
+    count: int = Field(default=0)
+
+
+# ── Per-user, per-entity version counter (ETags) ────
+class EntityVersion(SQLModel, table=True):
+    __tablename__ = "entity_version"
+
+    user_id: int = Field(
+        foreign_key="user.user_id", primary_key=True, ondelete="CASCADE"
+    )
+    entity: str = Field(primary_key=True)
+    version: int = Field(default=0)
+
+
+# ── Scheduler lease (one leader per job) and last-run status ──
+class SchedulerLease(SQLModel, table=True):
+    __tablename__ = "scheduler_lease"
+
+    job: str = Field(primary_key=True)
+    holder: str
+    expires_at: datetime
+    last_run_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    last_rows: Optional[int] = None
+    last_error: Optional[str] = None
@@ -1,12 +1,14 @@
 # backend/app/routers/accounts.py# ── Imports ──────────────────────────────────────────────────
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from app.models import Account
 from app.schemas.account import AccountCreate, AccountRead, AccountUpdate
-from app.core.security import get_current_user
-from app.db import get_session
+from app.core.security import get_current_user, get_read_session
+from app.db import get_session, note_write
+from app.services.cache import read_cache
+from app.services.versions import ACCOUNTS, bump_versions, entity_version, not_modified
 
 
 # ── Router setup ────────────────────────────────────────────
@@ -21,8 +23,11 @@ async def create_account(
     session: AsyncSession = Depends(get_session),
 ):
     acct = Account(**account_in.dict(), user_id=current.user_id)
+    acct.opening_balance = acct.balance
     session.add(acct)
+    await bump_versions(session, current.user_id, ACCOUNTS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(acct)
     return acct
 
@@ -30,13 +35,23 @@ async def create_account(
 # ── Read user’s accounts ────────────────────────────────────
 @router.get("", response_model=List[AccountRead])
 async def read_accounts(
+    request: Request,
+    response: Response,
     current=Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
-    result = await session.exec(
-        select(Account).where(Account.user_id == current.user_id)
-    )
-    return result.all()
+    version = await entity_version(session, current.user_id, ACCOUNTS)
+    cached = not_modified(request, response, current.user_id, ACCOUNTS, version)
+    if cached:
+        return cached
+
+    async def load():
+        result = await session.exec(
+            select(Account).where(Account.user_id == current.user_id)
+        )
+        return result.all()
+
+    return await read_cache.get_or_load(current.user_id, ACCOUNTS, version, "", load)
 
 
 # ── Update account ───────────────────────────────────────
@@ -50,9 +65,15 @@ async def update_account(
     acct = await session.get(Account, account_id)
     if not acct or acct.user_id != current.user_id:
         raise HTTPException(status_code=404, detail="Account not found")
-    for k, v in updates.dict(exclude_unset=True).items():
+    data = updates.dict(exclude_unset=True)
+    # ── Manual balance edits shift the opening balance too ─
+    if data.get("balance") is not None:
+        acct.opening_balance += data["balance"] - acct.balance
+    for k, v in data.items():
         setattr(acct, k, v)
+    await bump_versions(session, current.user_id, ACCOUNTS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(acct)
     return acct
 
@@ -68,5 +89,7 @@ async def delete_account(
     if not acct or acct.user_id != current.user_id:
         raise HTTPException(status_code=404, detail="Account not found")
     await session.delete(acct)
+    await bump_versions(session, current.user_id, ACCOUNTS)
     await session.commit()
+    await note_write(current.user_id)
     return
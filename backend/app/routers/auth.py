@@ -6,7 +6,7 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from app.models import User
 from app.schemas.user import UserCreate, UserRead
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import create_access_token, hash_password, verify_and_rehash
 from app.db import get_session
 
 
@@ -36,7 +36,7 @@ async def signup(
     user = User(
         name=user_in.name,
         email=user_in.email,
-        password_hash=hash_password(user_in.password),
+        password_hash=await hash_password(user_in.password),
     )
     session.add(user)
     await session.commit()
@@ -53,8 +53,17 @@ async def login(
     # ── Verify credentials ───────────────────────────────────
     result = await session.exec(select(User).where(User.email == form_data.username))
     user = result.first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
+    valid, new_hash = await verify_and_rehash(form_data.password, user.password_hash)
+    if not valid:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
+
+    # ── Upgrade hashes made with an older cost factor ───────
+    if new_hash:
+        user.password_hash = new_hash
+        session.add(user)
+        await session.commit()
 
     # ── Create access token ─────────────────────────────────
     token = create_access_token({"sub": str(user.user_id)})
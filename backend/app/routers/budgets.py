@@ -1,12 +1,24 @@
 # backend/app/routers/budgets.py
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import and_, case, cast, func, literal, or_
+from sqlalchemy.dialects.postgresql import INTERVAL
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
-from app.models import Budget
-from app.schemas.budget import BudgetCreate, BudgetRead, BudgetUpdate
-from app.core.security import get_current_user
-from app.db import get_session
+from app.models import Budget, Transaction
+from app.schemas.budget import BudgetCreate, BudgetProgress, BudgetRead, BudgetUpdate
+from app.core.security import get_current_user, get_read_session
+from app.services.ledger import SIGNED_AMOUNT
+from app.services.cache import read_cache
+from app.services.versions import (
+    BUDGETS,
+    TRANSACTIONS,
+    bump_versions,
+    entity_version,
+    not_modified,
+)
+from app.db import get_session, note_write
 
 
 # ── Router setup ───────────────────────────────────────────
@@ -22,7 +34,9 @@ async def create_budget(
 ):
     b = Budget(**budget_in.dict(), user_id=current.user_id)
     session.add(b)
+    await bump_versions(session, current.user_id, BUDGETS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(b)
     return b
 
@@ -30,11 +44,79 @@ async def create_budget(
 # ── Get all budgets ───────────────────────────────────────
 @router.get("", response_model=List[BudgetRead])
 async def read_budgets(
+    request: Request,
+    response: Response,
     current=Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
-    result = await session.exec(select(Budget).where(Budget.user_id == current.user_id))
-    return result.all()
+    version = await entity_version(session, current.user_id, BUDGETS)
+    cached = not_modified(request, response, current.user_id, BUDGETS, version)
+    if cached:
+        return cached
+
+    async def load():
+        stmt = select(Budget).where(Budget.user_id == current.user_id)
+        return (await session.exec(stmt)).all()
+
+    return await read_cache.get_or_load(current.user_id, BUDGETS, version, "", load)
+
+
+# ── Budget vs actual for the current period ─────────────
+@router.get("/progress", response_model=List[BudgetProgress])
+async def budget_progress(
+    current=Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+):
+    now = datetime.utcnow()
+    unit = case(
+        (Budget.period == "weekly", "week"),
+        (Budget.period == "yearly", "year"),
+        else_="month",
+    )
+    period_start = func.date_trunc(unit, now)
+    period_end = period_start + cast(literal("1 ") + unit, INTERVAL)
+
+    # Income budgets count money in, every other section money out
+    oriented = case((Budget.section == "income", SIGNED_AMOUNT), else_=-SIGNED_AMOUNT)
+
+    # ── One grouped aggregate across all of the user's budgets ─
+    stmt = (
+        select(
+            Budget,
+            period_start.label("period_start"),
+            period_end.label("period_end"),
+            func.coalesce(func.sum(oriented), 0.0).label("spent"),
+        )
+        .outerjoin(
+            Transaction,
+            and_(
+                Transaction.budget_id == Budget.budget_id,
+                Transaction.date >= period_start,
+                Transaction.date < period_end,
+            ),
+        )
+        .where(
+            Budget.user_id == current.user_id,
+            or_(Budget.start_date.is_(None), Budget.start_date <= now),
+            or_(Budget.end_date.is_(None), Budget.end_date >= now),
+        )
+        .group_by(Budget.budget_id)
+    )
+    rows = (await session.exec(stmt)).all()
+    return [
+        BudgetProgress(
+            budget_id=b.budget_id,
+            section=b.section,
+            label=b.label,
+            period=b.period,
+            period_start=start,
+            period_end=end,
+            amount=b.amount,
+            spent=float(spent),
+            remaining=b.amount - float(spent),
+        )
+        for b, start, end, spent in rows
+    ]
 
 
 # ── Update budget ───────────────────────────────────────
@@ -50,7 +132,9 @@ async def update_budget(
         raise HTTPException(status_code=404, detail="Budget not found")
     for k, v in updates.dict(exclude_unset=True).items():
         setattr(b, k, v)
+    await bump_versions(session, current.user_id, BUDGETS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(b)
     return b
 
@@ -66,4 +150,7 @@ async def delete_budget(
     if not b or b.user_id != current.user_id:
         raise HTTPException(status_code=404, detail="Budget not found")
     await session.delete(b)
+    # budget_id is SET NULL on its transactions, so their listings change too
+    await bump_versions(session, current.user_id, BUDGETS, TRANSACTIONS)
     await session.commit()
+    await note_write(current.user_id)
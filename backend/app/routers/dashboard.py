@@ -0,0 +1,100 @@
+# backend/app/routers/dashboard.py
+from typing import Any, List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db import read_session
+from app.models import Account, Budget, RecurringTransaction, Transaction
+from app.schemas.budget import BudgetRead
+from app.schemas.dashboard import DashboardRead, DashboardTotals
+from app.schemas.recurring import RecurringRead
+from app.schemas.transactions import TransactionRead
+from app.core.security import get_current_user
+from app.routers.goals import goals_with_totals
+
+
+# ── Router setup ───────────────────────────────────────────
+router = APIRouter(tags=["dashboard"])
+
+
+# ── The five reads behind the dashboard ──────────────────
+async def load_dashboard_parts(user_id: int, recent: int, upcoming: int) -> List[Any]:
+    """
+    Budgets, total balance, recent transactions, upcoming recurring and
+    goals, read one after another on a single pooled connection.
+    """
+
+    async def budgets(s: AsyncSession) -> Any:
+        return (
+            (await s.exec(select(Budget).where(Budget.user_id == user_id)))
+            .scalars()
+            .all()
+        )
+
+    async def balance(s: AsyncSession) -> Any:
+        return await s.scalar(
+            select(func.coalesce(func.sum(Account.balance), 0.0)).where(
+                Account.user_id == user_id
+            )
+        )
+
+    async def transactions(s: AsyncSession) -> Any:
+        q = (
+            select(Transaction)
+            .where(Transaction.user_id == user_id)
+            .order_by(Transaction.date.desc(), Transaction.transaction_id.desc())
+            .limit(recent)
+        )
+        return (await s.exec(q)).scalars().all()
+
+    async def recurring(s: AsyncSession) -> Any:
+        q = (
+            select(RecurringTransaction)
+            .where(
+                RecurringTransaction.user_id == user_id,
+                or_(
+                    RecurringTransaction.end_date.is_(None),
+                    RecurringTransaction.next_run_date <= RecurringTransaction.end_date,
+                ),
+            )
+            .order_by(RecurringTransaction.next_run_date)
+            .limit(upcoming)
+        )
+        return (await s.exec(q)).scalars().all()
+
+    async def goals(s: AsyncSession) -> Any:
+        return await goals_with_totals(s, user_id)
+
+    parts = [budgets, balance, transactions, recurring, goals]
+    async with read_session(user_id) as session:
+        return [await p(session) for p in parts]
+
+
+# ── Dashboard summary in one round-trip ───────────────────
+@router.get("", response_model=DashboardRead, response_model_by_alias=False)
+async def read_dashboard(
+    *,
+    recent: int = Query(5, ge=1, le=50, description="Recent transactions"),
+    upcoming: int = Query(5, ge=1, le=50, description="Upcoming recurring"),
+    current=Depends(get_current_user),
+):
+    b, bal, txs, recs, gs = await load_dashboard_parts(
+        current.user_id, recent, upcoming
+    )
+
+    income = sum(x.amount for x in b if x.section == "income")
+    expenses = sum(x.amount for x in b if x.section != "income")
+    return DashboardRead(
+        totals=DashboardTotals(
+            income=income,
+            expenses=expenses,
+            leftover=income - expenses,
+            balance=float(bal),
+        ),
+        budgets=[BudgetRead.model_validate(x, from_attributes=True) for x in b],
+        recent_transactions=[TransactionRead.model_validate(t) for t in txs],
+        goals=gs,
+        upcoming_recurring=[
+            RecurringRead.model_validate(r, from_attributes=True) for r in recs
+        ],
+    )
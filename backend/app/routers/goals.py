@@ -1,10 +1,11 @@
 # backend/app/routers/goals.py
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import insert, literal, tuple_
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, func, delete
+from sqlmodel import select, delete
 from datetime import datetime
-from app.db import get_session
+from app.db import get_session, note_write
 from app.models import Goal, GoalDeposit
 from app.schemas.goal import (
     GoalCreate,
@@ -12,8 +13,15 @@ from app.schemas.goal import (
     GoalUpdate,
     GoalDepositCreate,
     GoalDepositRead,
+    GoalDepositPage,
+    GoalDepositBulk,
+    GoalDepositBulkResult,
 )
-from app.core.security import get_current_user
+from app.core.security import get_current_user, get_read_session
+from app.services.cache import read_cache
+from app.services.goals import apply_goal_delta
+from app.services.versions import GOALS, bump_versions, entity_version, not_modified
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 # ── Router setup ───────────────────────────────────────────
@@ -29,34 +37,41 @@ async def create_goal(
 ):
     g = Goal(**goal_in.dict(), user_id=current.user_id)
     session.add(g)
+    await bump_versions(session, current.user_id, GOALS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(g)
     return g
 
 
+# ── Goals with deposit totals (shared with /dashboard) ─────
+async def goals_with_totals(session: AsyncSession, user_id: int) -> List[GoalRead]:
+    # Totals live on the goal row: one indexed scan, no join
+    result = await session.exec(
+        select(Goal).where(Goal.user_id == user_id).order_by(Goal.goal_id)
+    )
+    return [GoalRead.model_validate(g) for g in result.all()]
+
+
 # ── List goals with totals ──────────────────────────────
 @router.get("", response_model=List[GoalRead])
 async def list_goals(
+    request: Request,
+    response: Response,
     current=Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
-    # ── Sum deposits per goal ────────────────────────────
-    stmt = (
-        select(
-            Goal, func.coalesce(func.sum(GoalDeposit.amount), 0).label("current_amount")
-        )
-        .where(Goal.user_id == current.user_id)
-        .outerjoin(GoalDeposit, Goal.goal_id == GoalDeposit.goal_id)
-        .group_by(Goal.goal_id)
+    version = await entity_version(session, current.user_id, GOALS)
+    cached = not_modified(request, response, current.user_id, GOALS, version)
+    if cached:
+        return cached
+    return await read_cache.get_or_load(
+        current.user_id,
+        GOALS,
+        version,
+        "",
+        lambda: goals_with_totals(session, current.user_id),
     )
-    results = await session.exec(stmt)
-
-    out: List[GoalRead] = []
-    for goal, current_amount in results.all():
-        g = GoalRead.from_orm(goal)
-        g.current_amount = float(current_amount)
-        out.append(g)
-    return out
 
 
 # ── Update goal ───────────────────────────────────────
@@ -74,7 +89,9 @@ async def update_goal(
         setattr(g, k, v)
     g.updated_at = datetime.utcnow()
     session.add(g)
+    await bump_versions(session, current.user_id, GOALS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(g)
     return g
 
@@ -92,7 +109,9 @@ async def delete_goal(
     # ── Remove related deposits first ────────────────────
     await session.exec(delete(GoalDeposit).where(GoalDeposit.goal_id == goal_id))
     await session.delete(g)
+    await bump_versions(session, current.user_id, GOALS)
     await session.commit()
+    await note_write(current.user_id)
 
 
 # ── Add deposit ───────────────────────────────────────
@@ -107,27 +126,90 @@ async def add_deposit(
     current=Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
-    g = await session.get(Goal, goal_id)
-    if not g or g.user_id != current.user_id:
+    d = GoalDeposit(**deposit_in.dict(exclude_none=True), goal_id=goal_id)
+    # ── Bump the goal's totals; doubles as the ownership check ─
+    total = await apply_goal_delta(
+        session, current.user_id, goal_id, d.amount, 1, d.date
+    )
+    if total is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Goal not found")
-    d = GoalDeposit(**deposit_in.dict(), goal_id=goal_id)
     session.add(d)
+    await bump_versions(session, current.user_id, GOALS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(d)
     return d
 
 
-# ── List deposits for goal ─────────────────────────────
-@router.get("/{goal_id}/deposits", response_model=List[GoalDepositRead])
-async def list_deposits(
+# ── Bulk deposits / withdrawals ────────────────────────
+@router.post(
+    "/{goal_id}/deposits/bulk",
+    response_model=GoalDepositBulkResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_deposits_bulk(
     goal_id: int,
+    payload: GoalDepositBulk,
     current=Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+):
+    now = datetime.utcnow()
+    rows = [
+        {
+            "goal_id": goal_id,
+            "amount": item.amount,
+            "date": item.date or now,
+            "note": item.note,
+        }
+        for item in payload.items
+    ]
+    # ── One aggregated goal update, then one multi-row insert ─
+    total = await apply_goal_delta(
+        session,
+        current.user_id,
+        goal_id,
+        sum(r["amount"] for r in rows),
+        len(rows),
+        max(r["date"] for r in rows),
+    )
+    if total is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Goal not found")
+    await session.exec(insert(GoalDeposit), params=rows)
+    await bump_versions(session, current.user_id, GOALS)
+    await session.commit()
+    await note_write(current.user_id)
+    return GoalDepositBulkResult(inserted=len(rows), current_amount=total)
+
+
+# ── List deposits for goal (keyset paged) ──────────────
+@router.get("/{goal_id}/deposits", response_model=GoalDepositPage)
+async def list_deposits(
+    goal_id: int,
+    page_size: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page"
+    ),
+    current=Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
 ):
     g = await session.get(Goal, goal_id)
     if not g or g.user_id != current.user_id:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Goal not found")
-    result = await session.exec(
-        select(GoalDeposit).where(GoalDeposit.goal_id == goal_id)
+    q = select(GoalDeposit).where(GoalDeposit.goal_id == goal_id)
+    if cursor:
+        after_date, after_id = decode_cursor(cursor)
+        q = q.where(
+            tuple_(GoalDeposit.date, GoalDeposit.deposit_id)
+            > tuple_(literal(after_date), literal(after_id))
+        )
+    q = q.order_by(GoalDeposit.date, GoalDeposit.deposit_id).limit(page_size + 1)
+    items = (await session.exec(q)).all()
+
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_cursor(items[-1].date, items[-1].deposit_id)
+    return GoalDepositPage(
+        next_cursor=next_cursor,
+        items=[GoalDepositRead.model_validate(d) for d in items],
     )
-    return result.all()
@@ -1,17 +1,40 @@
 # backend/app/routers/recurring.py
+from datetime import date, datetime, time
+from itertools import islice
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
-from app.models import RecurringTransaction
-from app.schemas.recurring import RecurringCreate, RecurringRead, RecurringUpdate
-from app.core.security import get_current_user
-from app.db import get_session
+from app.models import Account, RecurringTransaction
+from app.schemas.recurring import (
+    RecurringCreate,
+    RecurringOccurrence,
+    RecurringRead,
+    RecurringUpdate,
+)
+from app.core.security import get_current_user, get_read_session
+from app.db import get_session, note_write
+from app.services.cache import read_cache
+from app.services.recurring import (
+    ACTIVE_RULE,
+    merge_occurrences,
+    recurring_timer,
+    schedule_rule,
+)
+from app.services.versions import RECURRING, bump_versions, entity_version, not_modified
 
 
 # ── Router setup ───────────────────────────────────────────
 router = APIRouter(tags=["recurring"])
 
+MAX_OCCURRENCES = 1000
+
+
+async def _check_account(session: AsyncSession, user_id: int, account_id: int) -> None:
+    acct = await session.get(Account, account_id)
+    if not acct or acct.user_id != user_id:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid account")
+
 
 # ── Create recurring transaction ─────────────────────────
 @router.post("", response_model=RecurringRead, status_code=status.HTTP_201_CREATED)
@@ -20,25 +43,73 @@ async def create_recurring(
     current=Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
+    await _check_account(session, current.user_id, rec_in.account_id)
     r = RecurringTransaction(**rec_in.dict(), user_id=current.user_id)
     session.add(r)
+    await bump_versions(session, current.user_id, RECURRING)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(r)
+    schedule_rule(r)
     return r
 
 
 # ── Get all recurring transactions ────────────────────────
 @router.get("", response_model=List[RecurringRead])
 async def read_recurrings(
+    request: Request,
+    response: Response,
     current=Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
+    version = await entity_version(session, current.user_id, RECURRING)
+    cached = not_modified(request, response, current.user_id, RECURRING, version)
+    if cached:
+        return cached
+
+    async def load():
+        result = await session.exec(
+            select(RecurringTransaction).where(
+                RecurringTransaction.user_id == current.user_id
+            )
+        )
+        return result.all()
+
+    return await read_cache.get_or_load(current.user_id, RECURRING, version, "", load)
+
+
+# ── Pending occurrences in a date window ─────────────────
+@router.get("/occurrences", response_model=List[RecurringOccurrence])
+async def list_occurrences(
+    start: date = Query(..., description="First day of the window"),
+    end: date = Query(..., description="Last day of the window (inclusive)"),
+    limit: int = Query(MAX_OCCURRENCES, ge=1, le=MAX_OCCURRENCES),
+    current=Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+):
+    if start > end:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "start must be <= end")
     result = await session.exec(
         select(RecurringTransaction).where(
-            RecurringTransaction.user_id == current.user_id
+            RecurringTransaction.user_id == current.user_id, ACTIVE_RULE
         )
     )
-    return result.all()
+    window = merge_occurrences(
+        result.all(),
+        datetime.combine(start, time.min),
+        datetime.combine(end, time.max),
+    )
+    return [
+        RecurringOccurrence(
+            recurring_id=r.recurring_id,
+            date=at,
+            account_id=r.account_id,
+            title=r.title,
+            amount=r.amount,
+            direction=r.direction,
+        )
+        for at, r in islice(window, limit)
+    ]
 
 
 # ── Update recurring transaction ────────────────────────
@@ -52,10 +123,15 @@ async def update_recurring(
     r = await session.get(RecurringTransaction, rec_id)
     if not r or r.user_id != current.user_id:
         raise HTTPException(status_code=404, detail="Recurring not found")
+    if updates.account_id is not None:
+        await _check_account(session, current.user_id, updates.account_id)
     for k, v in updates.dict(exclude_unset=True).items():
         setattr(r, k, v)
+    await bump_versions(session, current.user_id, RECURRING)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(r)
+    schedule_rule(r)
     return r
 
 
@@ -70,4 +146,7 @@ async def delete_recurring(
     if not r or r.user_id != current.user_id:
         raise HTTPException(status_code=404, detail="Recurring not found")
     await session.delete(r)
+    await bump_versions(session, current.user_id, RECURRING)
     await session.commit()
+    await note_write(current.user_id)
+    recurring_timer.remove(rec_id)
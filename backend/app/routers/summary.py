@@ -0,0 +1,186 @@
+# backend/app/routers/summary.py
+import math
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, literal, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Account, MonthlyRollup, RecurringTransaction, Transaction
+from app.schemas.summary import (
+    BalancePoint,
+    BalanceSeries,
+    ForecastSeries,
+    MonthlySummary,
+)
+from app.core.security import get_current_user, get_read_session
+from app.services.forecast import project_balances
+from app.services.ledger import SIGNED_AMOUNT
+from app.services.recurring import ACTIVE_RULE, add_months
+
+
+# ── Router setup ───────────────────────────────────────────
+router = APIRouter(tags=["summary"])
+
+YEAR_MONTH = r"^\d{4}-(0[1-9]|1[0-2])$"
+MAX_SERIES_POINTS = 500
+
+
+# ── Month-range summary from the rollup table ─────────────
+@router.get("/monthly", response_model=List[MonthlySummary])
+async def monthly_summary(
+    *,
+    start: Optional[str] = Query(None, pattern=YEAR_MONTH, description="YYYY-MM"),
+    end: Optional[str] = Query(None, pattern=YEAR_MONTH, description="YYYY-MM"),
+    account: Optional[int] = Query(None),
+    by_account: bool = Query(False, description="One row per account and month"),
+    current=Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+):
+    # Reads O(months × accounts) rollup rows, never the ledger
+    q = select(MonthlyRollup).where(MonthlyRollup.user_id == current.user_id)
+    if start:
+        q = q.where(MonthlyRollup.year_month >= start)
+    if end:
+        q = q.where(MonthlyRollup.year_month <= end)
+    if account:
+        q = q.where(MonthlyRollup.account_id == account)
+    rows = (await session.exec(q)).scalars().all()
+
+    buckets: Dict[Tuple[str, Optional[int]], MonthlySummary] = {}
+    for r in rows:
+        key = (r.year_month, r.account_id if by_account else None)
+        s = buckets.get(key)
+        if s is None:
+            s = buckets[key] = MonthlySummary(
+                year_month=key[0],
+                account_id=key[1],
+                deposits=0.0,
+                withdrawals=0.0,
+                net=0.0,
+                deposit_count=0,
+                withdrawal_count=0,
+            )
+        if r.direction == "deposit":
+            s.deposits += r.total
+            s.deposit_count += r.count
+            s.net += r.total
+        else:
+            s.withdrawals += r.total
+            s.withdrawal_count += r.count
+            s.net -= r.total
+    return [buckets[k] for k in sorted(buckets, key=lambda k: (k[0], k[1] or 0))]
+
+
+# ── Running balance per account, downsampled ─────────────
+@router.get("/balances", response_model=List[BalanceSeries])
+async def balance_series(
+    *,
+    start: Optional[date] = Query(None, description="Defaults to 90 days ago"),
+    end: Optional[date] = Query(None, description="Defaults to today"),
+    account: Optional[int] = Query(None),
+    resolution: Literal["daily", "weekly"] = Query("daily"),
+    max_points: int = Query(MAX_SERIES_POINTS, ge=2, le=MAX_SERIES_POINTS),
+    current=Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+):
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=90)
+    if start > end:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "start must be <= end")
+
+    # ── Widen the step until the range fits in max_points ──
+    span = (end - start).days + 1
+    step = max(7 if resolution == "weekly" else 1, math.ceil(span / max_points))
+    origin = datetime.combine(start, datetime.min.time())
+    until = datetime.combine(end, datetime.min.time()) + timedelta(days=1)
+
+    acct_q = select(Account.account_id, Account.opening_balance).where(
+        Account.user_id == current.user_id
+    )
+    if account:
+        acct_q = acct_q.where(Account.account_id == account)
+    openings = dict((await session.exec(acct_q)).all())
+
+    # ── Bucket net per account, then SUM() OVER for running ──
+    bucket = func.date_bin(literal(timedelta(days=step)), Transaction.date, origin)
+    nets = (
+        select(
+            Transaction.account_id,
+            bucket.label("bucket"),
+            func.sum(SIGNED_AMOUNT).label("net"),
+        )
+        .where(Transaction.user_id == current.user_id, Transaction.date < until)
+        .group_by(Transaction.account_id, bucket)
+    )
+    if account:
+        nets = nets.where(Transaction.account_id == account)
+    nets = nets.subquery()
+    running = select(
+        nets.c.account_id,
+        nets.c.bucket,
+        func.sum(nets.c.net)
+        .over(partition_by=nets.c.account_id, order_by=nets.c.bucket)
+        .label("running"),
+        func.lead(nets.c.bucket)
+        .over(partition_by=nets.c.account_id, order_by=nets.c.bucket)
+        .label("next_bucket"),
+    ).subquery()
+    # In-range buckets plus the last one before the range (carry-in)
+    stmt = (
+        select(running.c.account_id, running.c.bucket, running.c.running)
+        .where(
+            or_(
+                running.c.bucket >= origin,
+                running.c.next_bucket.is_(None),
+                running.c.next_bucket >= origin,
+            )
+        )
+        .order_by(running.c.account_id, running.c.bucket)
+    )
+    changes: Dict[int, List[Tuple[datetime, float]]] = {}
+    for acct_id, at, total in (await session.exec(stmt)).all():
+        changes.setdefault(acct_id, []).append((at, total))
+
+    # ── Fill forward onto the fixed grid: O(points) per account ─
+    out: List[BalanceSeries] = []
+    for acct_id in sorted(openings):
+        opening = openings[acct_id]
+        rows = changes.get(acct_id, [])
+        points: List[BalancePoint] = []
+        i, running_total = 0, 0.0
+        day = start
+        while day <= end:
+            cutoff = datetime.combine(day, datetime.min.time())
+            while i < len(rows) and rows[i][0] <= cutoff:
+                running_total = rows[i][1]
+                i += 1
+            points.append(BalancePoint(date=day, balance=opening + running_total))
+            day += timedelta(days=step)
+        out.append(BalanceSeries(account_id=acct_id, step_days=step, points=points))
+    return out
+
+
+# ── Cash-flow forecast from recurring rules ──────────────
+@router.get("/forecast", response_model=List[ForecastSeries])
+async def cash_flow_forecast(
+    *,
+    months: int = Query(3, ge=3, le=24, description="Horizon in months"),
+    account: Optional[int] = Query(None),
+    current=Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
+):
+    today = datetime.utcnow().date()
+    horizon_end = add_months(today, months, today.day)
+
+    acct_q = select(Account.account_id, Account.balance).where(
+        Account.user_id == current.user_id
+    )
+    rule_q = select(RecurringTransaction).where(
+        RecurringTransaction.user_id == current.user_id, ACTIVE_RULE
+    )
+    if account:
+        acct_q = acct_q.where(Account.account_id == account)
+        rule_q = rule_q.where(RecurringTransaction.account_id == account)
+    balances = dict((await session.exec(acct_q)).all())
+    rules = (await session.exec(rule_q)).scalars().all()
+    return project_balances(balances, rules, today, horizon_end)
@@ -1,23 +1,82 @@
 # backend/app/routers/transactions.py
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Literal, Optional
 from datetime import date, datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import cast, func, insert, literal, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.db import get_session
-from app.models import Transaction, User, Account
+from app.db import get_session, note_write, read_session
+from app.models import Transaction, Account, Budget
 from app.schemas.transactions import (
     TransactionCreate,
     TransactionRead,
     TransactionUpdate,
     TransactionReadPage,
+    TransactionImportError,
+    TransactionImportResult,
+)
+from app.core.security import Principal, get_current_user, get_read_session
+from app.services.exporters import csv_chunk, csv_header, gzip_stream, ndjson_chunk
+from app.services.importers import ImportFileError, iter_csv_rows, iter_ofx_rows
+from app.services.ledger import add_delta, apply_balance_deltas, signed_amount
+from app.services.rollups import RollupDeltas, add_rollup, apply_rollup_deltas
+from app.services.versions import (
+    ACCOUNTS,
+    TRANSACTIONS,
+    bump_versions,
+    entity_version,
+    not_modified,
 )
-from app.core.security import get_current_user
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 # ── Router setup ───────────────────────────────────────────
 router = APIRouter(tags=["transactions"])
 
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+EXPORT_CHUNK_SIZE = 500
+
+
+# ── Shared user / date-range / account filters ─────────────
+def _filters(
+    user_id: int,
+    start: Optional[date],
+    end: Optional[date],
+    account: Optional[int],
+) -> List:
+    clauses = [Transaction.user_id == user_id]
+    if start:
+        clauses.append(Transaction.date >= datetime.combine(start, datetime.min.time()))
+    if end:
+        clauses.append(Transaction.date <= datetime.combine(end, datetime.max.time()))
+    if account:
+        clauses.append(Transaction.account_id == account)
+    return clauses
+
+
+async def _check_budget(
+    session: AsyncSession, user_id: int, budget_id: Optional[int]
+) -> None:
+    if budget_id is None:
+        return
+    b = await session.get(Budget, budget_id)
+    if not b or b.user_id != user_id:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid budget")
+
 
 # ── List transactions with filters & pagination ────────────
 @router.get(
@@ -27,44 +86,128 @@ router = APIRouter(tags=["transactions"])
 )
 async def list_transactions(
     *,
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page"
+    ),
+    include_total: bool = Query(
+        True, description="Run the exact COUNT(*); ignored with cursor"
+    ),
+    search: Optional[str] = Query(
+        None,
+        alias="q",
+        min_length=1,
+        max_length=200,
+        description="Full-text / fuzzy search over title and description",
+    ),
     start: Optional[date] = Query(None),
     end: Optional[date] = Query(None),
     account: Optional[int] = Query(None),
-    current: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    current: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
 ):
-    base = Transaction.user_id == current.user_id
-    q = select(Transaction).where(base)
+    version = await entity_version(session, current.user_id, TRANSACTIONS)
+    cached = not_modified(request, response, current.user_id, TRANSACTIONS, version)
+    if cached:
+        return cached
 
-    if start:
-        q = q.where(Transaction.date >= datetime.combine(start, datetime.min.time()))
-    if end:
-        q = q.where(Transaction.date <= datetime.combine(end, datetime.max.time()))
-    if account:
-        q = q.where(Transaction.account_id == account)
+    q = select(Transaction).where(*_filters(current.user_id, start, end, account))
+    order = [Transaction.date.desc(), Transaction.transaction_id.desc()]
 
-    total = await session.scalar(
-        select(func.count()).select_from(Transaction).where(q.whereclause)
-    )
+    # ── Search: tsvector match or trigram word similarity ──
+    if search:
+        if cursor:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST, "cursor cannot be combined with q"
+            )
+        tsq = func.websearch_to_tsquery(cast("english", REGCONFIG), search)
+        vector = Transaction.__table__.c.search_vector
+        q = q.where(or_(vector.op("@@")(tsq), Transaction.title.op("%>")(search)))
+        rank = func.greatest(
+            func.ts_rank(vector, tsq), func.word_similarity(search, Transaction.title)
+        )
+        order.insert(0, rank.desc())
 
-    q = (
-        q.order_by(Transaction.date.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
+    # ── Exact total is optional; cursor scrolling skips it ─
+    total = None
+    if include_total and not cursor:
+        total = await session.scalar(
+            select(func.count()).select_from(Transaction).where(q.whereclause)
+        )
+
+    # ── Keyset mode seeks past the cursor, offset mode skips ─
+    if cursor:
+        after_date, after_id = decode_cursor(cursor)
+        q = q.where(
+            tuple_(Transaction.date, Transaction.transaction_id)
+            < tuple_(literal(after_date), literal(after_id))
+        )
+    else:
+        q = q.offset((page - 1) * page_size)
+
+    q = q.order_by(*order).limit(page_size + 1)
     result = await session.exec(q)
     items = result.scalars().all()
 
+    # Ranked results page by offset only; the cursor key is (date, id)
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        if not search:
+            next_cursor = encode_cursor(last.date, last.transaction_id)
+
     return TransactionReadPage(
         total=total,
-        page=page,
+        page=None if cursor else page,
         page_size=page_size,
+        next_cursor=next_cursor,
         items=[TransactionRead.model_validate(t) for t in items],
     )
 
 
+# ── Stream the full ledger as CSV / NDJSON ─────────────────
+@router.get("/export")
+async def export_transactions(
+    *,
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    compress: bool = Query(False, alias="gzip", description="gzip on the fly"),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    account: Optional[int] = Query(None),
+    current: Principal = Depends(get_current_user),
+):
+    q = (
+        select(Transaction)
+        .where(*_filters(current.user_id, start, end, account))
+        .order_by(Transaction.date, Transaction.transaction_id)
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+    serialise = csv_chunk if fmt == "csv" else ndjson_chunk
+
+    async def rows() -> AsyncIterator[bytes]:
+        # Own session: request-scoped dependencies close before streaming
+        async with read_session(current.user_id) as session:
+            if fmt == "csv":
+                yield csv_header().encode()
+            result = await session.stream_scalars(q)
+            async for chunk in result.partitions(EXPORT_CHUNK_SIZE):
+                yield serialise(chunk).encode()
+                session.expunge_all()
+
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    filename = f"transactions.{fmt}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    body = rows()
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        body = gzip_stream(body)
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
 # ── Get one transaction ────────────────────────────────────
 @router.get(
     "/{tx_id}",
@@ -73,8 +216,8 @@ async def list_transactions(
 )
 async def get_transaction(
     tx_id: int,
-    current: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_session),
+    current: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_read_session),
 ):
     tx = await session.get(Transaction, tx_id)
     if not tx or tx.user_id != current.user_id:
@@ -91,27 +234,163 @@ async def get_transaction(
 )
 async def create_transaction(
     payload: TransactionCreate,
-    current: User = Depends(get_current_user),
+    current: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
-    tx = Transaction(**payload.dict(), user_id=current.user_id)
-    session.add(tx)
+    await _check_budget(session, current.user_id, payload.budget_id)
 
-    acct = await session.get(Account, payload.account_id)
-    if not acct or acct.user_id != current.user_id:
+    # ── Atomic balance bump doubles as the ownership check ─
+    delta = signed_amount(payload.direction, payload.amount)
+    updated = await apply_balance_deltas(
+        session, current.user_id, {payload.account_id: delta}
+    )
+    if payload.account_id not in updated:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid account")
 
-    if payload.direction == "deposit":
-        acct.balance += payload.amount
-    else:
-        acct.balance -= payload.amount
+    tx = Transaction(**payload.dict(exclude_none=True), user_id=current.user_id)
+    session.add(tx)
 
-    session.add(acct)
+    rollup: RollupDeltas = {}
+    add_rollup(rollup, tx.account_id, tx.date, tx.direction, tx.amount)
+    await apply_rollup_deltas(session, current.user_id, rollup)
+    await bump_versions(session, current.user_id, TRANSACTIONS, ACCOUNTS)
     await session.commit()
+    await note_write(current.user_id)
     await session.refresh(tx)
     return TransactionRead.model_validate(tx)
 
 
+# ── Bulk import from CSV / OFX ─────────────────────────
+@router.post(
+    "/import",
+    response_model=TransactionImportResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_transactions(
+    file: UploadFile = File(...),
+    fmt: Optional[Literal["csv", "ofx"]] = Query(
+        None, alias="format", description="Defaults to the file extension"
+    ),
+    account: Optional[int] = Query(
+        None, description="Target account for OFX, or CSV rows without one"
+    ),
+    current: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    if fmt is None:
+        name = (file.filename or "").lower()
+        fmt = "ofx" if name.endswith((".ofx", ".qfx")) else "csv"
+
+    owned = set(
+        (
+            await session.exec(
+                select(Account.account_id).where(Account.user_id == current.user_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if account is not None and account not in owned:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid account")
+    owned_budgets = set(
+        (
+            await session.exec(
+                select(Budget.budget_id).where(Budget.user_id == current.user_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    rows = iter_ofx_rows(file.file) if fmt == "ofx" else iter_csv_rows(file.file)
+    now = datetime.utcnow()
+    deltas: Dict[int, float] = {}
+    rollup: RollupDeltas = {}
+    errors: List[TransactionImportError] = []
+    imported = failed = 0
+
+    def reject(line_no: int, error: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < IMPORT_MAX_ERRORS:
+            errors.append(TransactionImportError(row=line_no, error=error))
+
+    def next_batch() -> List[Dict]:
+        # Decoding, parsing and validation are CPU-bound: runs in a thread
+        batch: List[Dict] = []
+        try:
+            for line_no, fields in rows:
+                if fields.get("account_id") is None:
+                    fields["account_id"] = account
+                try:
+                    tx_in = TransactionCreate.model_validate(fields)
+                    error = None
+                    if tx_in.account_id not in owned:
+                        error = "Invalid account"
+                    elif (
+                        tx_in.budget_id is not None
+                        and tx_in.budget_id not in owned_budgets
+                    ):
+                        error = "Invalid budget"
+                except ValidationError as exc:
+                    err = exc.errors()[0]
+                    where = ".".join(str(p) for p in err["loc"])
+                    error = f"{where}: {err['msg']}" if where else err["msg"]
+                if error:
+                    reject(line_no, error)
+                    continue
+
+                row = {
+                    "user_id": current.user_id,
+                    "account_id": tx_in.account_id,
+                    "budget_id": tx_in.budget_id,
+                    "title": tx_in.title,
+                    "description": tx_in.description or "",
+                    "amount": tx_in.amount,
+                    "direction": tx_in.direction,
+                    "date": tx_in.date or now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                batch.append(row)
+                add_delta(
+                    deltas,
+                    tx_in.account_id,
+                    signed_amount(tx_in.direction, tx_in.amount),
+                )
+                add_rollup(
+                    rollup,
+                    row["account_id"],
+                    row["date"],
+                    tx_in.direction,
+                    tx_in.amount,
+                )
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    break
+        except ImportFileError as exc:
+            # Rows before the damage are kept; the rest cannot be read
+            reject(exc.row, exc.message)
+        return batch
+
+    # ── Parse off the event loop, insert in multi-row batches ─
+    while True:
+        batch = await run_in_threadpool(next_batch)
+        if not batch:
+            break
+        await session.exec(insert(Transaction), params=batch)
+        imported += len(batch)
+
+    # ── One aggregated balance delta per touched account ───
+    await apply_balance_deltas(session, current.user_id, deltas, now)
+    await apply_rollup_deltas(session, current.user_id, rollup)
+
+    await bump_versions(session, current.user_id, TRANSACTIONS, ACCOUNTS)
+    await session.commit()
+    await note_write(current.user_id)
+
+    return TransactionImportResult(imported=imported, failed=failed, errors=errors)
+
+
 # ── Update transaction & adjust balances ────────────────
 @router.patch(
     "/{tx_id}",
@@ -121,42 +400,40 @@ async def create_transaction(
 async def update_transaction(
     tx_id: int,
     payload: TransactionUpdate,
-    current: User = Depends(get_current_user),
+    current: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
-    tx = await session.get(Transaction, tx_id)
+    tx = await session.get(Transaction, tx_id, with_for_update=True)
     if not tx or tx.user_id != current.user_id:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Transaction not found")
 
-    # Old values
-    old_amount = tx.amount
-    old_direction = tx.direction
-    old_account_id = tx.account_id
+    await _check_budget(session, current.user_id, payload.budget_id)
+
+    # Reverse old effect
+    deltas: Dict[int, float] = {}
+    rollup: RollupDeltas = {}
+    add_delta(deltas, tx.account_id, -signed_amount(tx.direction, tx.amount))
+    add_rollup(rollup, tx.account_id, tx.date, tx.direction, tx.amount, sign=-1)
 
     # Apply updates
     for field, value in payload.dict(exclude_unset=True).items():
         setattr(tx, field, value)
 
-    # Reverse old effect
-    acct_old = await session.get(Account, old_account_id)
-    if old_direction == "deposit":
-        acct_old.balance -= old_amount
-    else:
-        acct_old.balance += old_amount
-    session.add(acct_old)
-
-    # Apply new effect
-    acct_new = await session.get(Account, tx.account_id)
-    if tx.direction == "deposit":
-        acct_new.balance += tx.amount
-    else:
-        acct_new.balance -= tx.amount
-    session.add(acct_new)
+    # Apply new effect; both accounts move in one lock-ordered pass
+    add_delta(deltas, tx.account_id, signed_amount(tx.direction, tx.amount))
+    add_rollup(rollup, tx.account_id, tx.date, tx.direction, tx.amount)
+    updated = await apply_balance_deltas(session, current.user_id, deltas)
+    if tx.account_id not in updated:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid account")
+    await apply_rollup_deltas(session, current.user_id, rollup)
 
     tx.updated_at = datetime.utcnow()
     session.add(tx)
 
+    await bump_versions(session, current.user_id, TRANSACTIONS, ACCOUNTS)
     await session.commit()
+    await note_write(current.user_id)
+
     await session.refresh(tx)
     return TransactionRead.model_validate(tx)
 
@@ -165,20 +442,23 @@ async def update_transaction(
 @router.delete("/{tx_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_transaction(
     tx_id: int,
-    current: User = Depends(get_current_user),
+    current: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ):
-    tx = await session.get(Transaction, tx_id)
+    tx = await session.get(Transaction, tx_id, with_for_update=True)
     if not tx or tx.user_id != current.user_id:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Transaction not found")
 
-    acct = await session.get(Account, tx.account_id)
-    if tx.direction == "deposit":
-        acct.balance -= tx.amount
-    else:
-        acct.balance += tx.amount
-    session.add(acct)
-
+    await apply_balance_deltas(
+        session,
+        current.user_id,
+        {tx.account_id: -signed_amount(tx.direction, tx.amount)},
+    )
+    rollup: RollupDeltas = {}
+    add_rollup(rollup, tx.account_id, tx.date, tx.direction, tx.amount, sign=-1)
+    await apply_rollup_deltas(session, current.user_id, rollup)
     await session.delete(tx)
+    await bump_versions(session, current.user_id, TRANSACTIONS, ACCOUNTS)
     await session.commit()
+    await note_write(current.user_id)
     return
@@ -1,40 +1,26 @@
 # backend/app/routers/users.py
-from typing import Any, Dict
-from datetime import datetime, timezone
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Response, status
-from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db import get_session
 from app.models import User
 from app.schemas.user import UserRead, UserUpdate
-from app.core.security import hash_password, verify_password, SECRET_KEY, ALGORITHM
+from app.core.security import (
+    Principal,
+    get_current_user,
+    hash_password,
+    principal_cache,
+    verify_password,
+)
 
 
 # ── Router setup ───────────────────────────────────────────
 router = APIRouter(tags=["users"])
-oauth2 = OAuth2PasswordBearer(tokenUrl="auth/token")
 
 
-# ── Decode token & load user ───────────────────────────────
-async def get_current_user(
-    token: str = Depends(oauth2),
-    session: AsyncSession = Depends(get_session),
-) -> User:
-    try:
-        payload: Dict[str, Any] = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        sub = payload.get("sub")
-        if not isinstance(sub, str):
-            raise ValueError
-        user_id = int(sub)
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
-        )
-
-    result = await session.exec(select(User).where(User.user_id == user_id))
-    user = result.first()
+# ── Load the full user row behind a principal ──────────────
+async def _load_user(session: AsyncSession, current: Principal) -> User:
+    user = await session.get(User, current.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
@@ -44,28 +30,32 @@ async def get_current_user(
 
 # ── Get user profile ─────────────────────────────────────────
 @router.get("/me", response_model=UserRead)
-async def read_me(current: User = Depends(get_current_user)) -> UserRead:
-    return UserRead.model_validate(current)
+async def read_me(
+    current: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> UserRead:
+    return UserRead.model_validate(await _load_user(session, current))
 
 
 # ── Update user profile ─────────────────────────────────────
 @router.patch("/me", response_model=UserRead)
 async def update_me(
     updates: UserUpdate,
-    current: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> UserRead:
+    current = await _load_user(session, principal)
     data = updates.model_dump(exclude_unset=True)
 
     # ── Verify & re-hash password ──────────────────────────
     if "new_password" in data:
-        if not data.get("current_password") or not verify_password(
+        if not data.get("current_password") or not await verify_password(
             data["current_password"], current.password_hash
         ):
             raise HTTPException(
                 status.HTTP_400_BAD_REQUEST, detail="Current password is incorrect"
             )
-        current.password_hash = hash_password(data["new_password"])
+        current.password_hash = await hash_password(data["new_password"])
 
     # ── Apply name/email updates ───────────────────────────
     data.pop("current_password", None)
@@ -77,6 +67,7 @@ async def update_me(
     current.updated_at = datetime.utcnow()
     session.add(current)
     await session.commit()
+    await principal_cache.invalidate_user(current.user_id)
     await session.refresh(current)
     return UserRead.model_validate(current)
 
@@ -84,9 +75,10 @@ async def update_me(
 # ── Delete user account ─────────────────────────────────────
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_me(
-    current: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> Response:
-    await session.delete(current)
+    await session.delete(await _load_user(session, principal))
     await session.commit()
+    await principal_cache.invalidate_user(principal.user_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -25,6 +25,9 @@ class BudgetBase(BaseModel):
     section: Section
     label: str
     amount: float
+    period: BudgetPeriod = BudgetPeriod.monthly
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
 
 
 # ── Input (creating) ─────────────────────────────────
@@ -45,7 +48,22 @@ class BudgetRead(BudgetBase):
 
 # ── Input (updating)  ────────────────────────────
 class BudgetUpdate(BaseModel):
-    amount_limit: Optional[float] = None
+    section: Optional[Section] = None
+    label: Optional[str] = None
+    amount: Optional[float] = None
     period: Optional[BudgetPeriod] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+
+
+# ── Budget vs actual for the current period ─────────────
+class BudgetProgress(BaseModel):
+    budget_id: int
+    section: Section
+    label: str
+    period: BudgetPeriod
+    period_start: datetime
+    period_end: datetime
+    amount: float
+    spent: float = Field(..., description="Received, for income budgets")
+    remaining: float
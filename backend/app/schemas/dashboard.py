@@ -0,0 +1,24 @@
+# backend/app/schemas/dashboard.py
+from typing import List
+from pydantic import BaseModel, Field
+from app.schemas.budget import BudgetRead
+from app.schemas.goal import GoalRead
+from app.schemas.recurring import RecurringRead
+from app.schemas.transactions import TransactionRead
+
+
+# ── Headline numbers ──────────────────────────────────────
+class DashboardTotals(BaseModel):
+    income: float = Field(..., description="Sum of income budgets")
+    expenses: float = Field(..., description="Sum of all other budgets")
+    leftover: float
+    balance: float = Field(..., description="Sum of account balances")
+
+
+# ── Whole dashboard in one payload ────────────────────────
+class DashboardRead(BaseModel):
+    totals: DashboardTotals
+    budgets: List[BudgetRead]
+    recent_transactions: List[TransactionRead]
+    goals: List[GoalRead]
+    upcoming_recurring: List[RecurringRead]
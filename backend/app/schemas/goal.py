@@ -1,6 +1,6 @@
 # backend/app/schemas/goal.py
 from datetime import datetime
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -29,6 +29,8 @@ class GoalRead(GoalBase):
     created_at: datetime
     updated_at: datetime
     current_amount: float = Field(0.0, description="Sum of all deposits")
+    deposit_count: int = 0
+    last_deposit_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -60,3 +62,29 @@ class GoalDepositRead(GoalDepositBase):
     goal_id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# ── Page of deposits (oldest first) ──────────────────
+class GoalDepositPage(BaseModel):
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as ?cursor= to fetch the next page"
+    )
+    items: List[GoalDepositRead]
+
+
+# ── Bulk deposits / withdrawals ──────────────────────
+BULK_MAX_DEPOSITS = 1000
+
+
+class GoalDepositBulk(BaseModel):
+    items: List[GoalDepositCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=BULK_MAX_DEPOSITS,
+        description="Negative amounts withdraw from the goal",
+    )
+
+
+class GoalDepositBulkResult(BaseModel):
+    inserted: int
+    current_amount: float
@@ -54,3 +54,13 @@ class RecurringRead(RecurringBase):
 
     class Config:
         orm_mode = True
+
+
+# ── One pending occurrence (calendar view) ────────────
+class RecurringOccurrence(BaseModel):
+    recurring_id: int
+    date: datetime
+    account_id: int
+    title: Optional[str] = None
+    amount: float
+    direction: TransactionDirection
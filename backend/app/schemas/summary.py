@@ -0,0 +1,37 @@
+# backend/app/schemas/summary.py
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+# ── Monthly in/out summary ────────────────────────────────
+class MonthlySummary(BaseModel):
+    year_month: str = Field(..., description="YYYY-MM")
+    account_id: Optional[int] = Field(None, description="Set when by_account=true")
+    deposits: float
+    withdrawals: float
+    net: float
+    deposit_count: int
+    withdrawal_count: int
+
+
+# ── Running balance series ────────────────────────────────
+class BalancePoint(BaseModel):
+    date: date
+    balance: float = Field(..., description="Closing balance of the step from date")
+
+
+class BalanceSeries(BaseModel):
+    account_id: int
+    step_days: int = Field(..., description="Days between points after downsampling")
+    points: List[BalancePoint]
+
+
+# ── Cash-flow forecast from recurring rules ───────────────
+class ForecastSeries(BaseModel):
+    account_id: int
+    start_balance: float
+    first_negative: Optional[date] = Field(
+        None, description="First day the projected balance drops below zero"
+    )
+    points: List[BalancePoint]
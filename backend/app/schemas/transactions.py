@@ -16,6 +16,7 @@ class TransactionBase(BaseModel):
     )
     date: Optional[datetime] = Field(None, description="When the transaction occurred")
     account_id: int = Field(..., description="ID of the associated account")
+    budget_id: Optional[int] = Field(None, description="Budget this counts against")
 
 
 # ── Creating transactions ─────────────────────
@@ -33,6 +34,7 @@ class TransactionUpdate(BaseModel):
     direction: Optional[Literal["deposit", "withdrawal"]] = Field(None, alias="type")
     date: Optional[datetime] = None
     account_id: Optional[int] = None
+    budget_id: Optional[int] = None
 
 
 # ── Reading a transaction ──────────────────────
@@ -47,7 +49,24 @@ class TransactionRead(TransactionBase):
 
 # ── Pagination response model ─────────────────────────────
 class TransactionReadPage(BaseModel):
-    total: int
-    page: int
+    total: Optional[int] = Field(
+        None, description="Omitted when include_total=false or paging by cursor"
+    )
+    page: Optional[int] = Field(None, description="Omitted when paging by cursor")
     page_size: int
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as ?cursor= to fetch the next page"
+    )
     items: List[TransactionRead]
+
+
+# ── Bulk import report ────────────────────────────────────
+class TransactionImportError(BaseModel):
+    row: int = Field(..., description="Line number in the uploaded file")
+    error: str
+
+
+class TransactionImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TransactionImportError]
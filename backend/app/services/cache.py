@@ -0,0 +1,134 @@
+# backend/app/services/cache.py
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from fastapi.encoders import jsonable_encoder
+from app.core.config import (
+    CACHE_BACKEND,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
+    CACHE_URL,
+)
+
+
+# ── Backends ──────────────────────────────────────────────
+class CacheBackend(ABC):
+    """Minimal async key-value interface the read cache needs."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: int) -> None: ...
+
+
+class NullBackend(CacheBackend):
+    async def get(self, key: str) -> Optional[str]:
+        return None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        return None
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU with per-entry TTL, bounded by `max_entries`. Each
+    worker keeps its own copy; entries are keyed on the DB entity version,
+    so a worker never serves data older than the version it just read.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+
+class RedisBackend(CacheBackend):
+    """Shared store for multi-worker deployments (needs `redis`)."""
+
+    def __init__(self, url: str = CACHE_URL) -> None:
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package"
+            ) from exc
+        self._client = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+
+def build_backend(name: str = CACHE_BACKEND) -> CacheBackend:
+    if name == "redis":
+        return RedisBackend()
+    if name == "none":
+        return NullBackend()
+    return MemoryBackend()
+
+
+# ── Read cache keyed on (user_id, entity, version) ────────
+class ReadCache:
+    """
+    Cache list responses per user and entity. Keys embed the
+    entity_version the caller just read (the number behind the ETag), so
+    a write is visible to every worker as soon as it commits its version
+    bump; older entries are never read again and age out via TTL or LRU.
+    A load racing a write can only store data at least as new as the
+    version in its key.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = CACHE_TTL_SECONDS) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    async def get_or_load(
+        self,
+        user_id: int,
+        entity: str,
+        version: int,
+        params: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = f"tv:{user_id}:{entity}:{version}:{params}"
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits[entity] = self.hits.get(entity, 0) + 1
+            return json.loads(cached)
+        self.misses[entity] = self.misses.get(entity, 0) + 1
+        value = jsonable_encoder(await loader())
+        await self.backend.set(key, json.dumps(value), self.ttl)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+        }
+
+
+read_cache = ReadCache(build_backend())
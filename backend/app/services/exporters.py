@@ -0,0 +1,63 @@
+# backend/app/services/exporters.py
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterator, List, Sequence
+from app.models import Transaction
+
+# ── Exported columns, in output order ─────────────────────
+EXPORT_FIELDS = [
+    "transaction_id",
+    "date",
+    "title",
+    "description",
+    "amount",
+    "direction",
+    "account_id",
+]
+
+
+def _row(tx: Transaction) -> List:
+    return [
+        tx.transaction_id,
+        tx.date.isoformat(),
+        tx.title,
+        tx.description,
+        tx.amount,
+        getattr(tx.direction, "value", tx.direction),
+        tx.account_id,
+    ]
+
+
+# ── Per-chunk serialisers ─────────────────────────────────
+def csv_header() -> str:
+    buf = io.StringIO()
+    csv.writer(buf).writerow(EXPORT_FIELDS)
+    return buf.getvalue()
+
+
+def csv_chunk(txs: Sequence[Transaction]) -> str:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for tx in txs:
+        writer.writerow(_row(tx))
+    return buf.getvalue()
+
+
+def ndjson_chunk(txs: Sequence[Transaction]) -> str:
+    return "".join(json.dumps(dict(zip(EXPORT_FIELDS, _row(tx)))) + "\n" for tx in txs)
+
+
+# ── On-the-fly gzip ───────────────────────────────────────
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Compress an async byte stream incrementally; memory stays bounded by
+    the zlib window rather than the full payload.
+    """
+    comp = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        out = comp.compress(chunk)
+        if out:
+            yield out
+    yield comp.flush()
@@ -0,0 +1,112 @@
+# backend/app/services/forecast.py
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from app.models import RecurringTransaction
+from app.schemas.summary import BalancePoint, ForecastSeries
+from app.services.ledger import signed_amount
+
+_MONTH_STEP = {"monthly": 1, "yearly": 12}
+_DAY_STEP = {"daily": 1, "weekly": 7}
+
+
+# ── Occurrence expansion (vectorized per rule) ────────────
+def occurrence_days(
+    rule: RecurringTransaction, horizon_end: np.datetime64
+) -> np.ndarray:
+    """
+    All occurrence dates of `rule` from its next_run_date through the
+    horizon (or its end_date), as datetime64[D]. Monthly and yearly
+    steps follow the engine: keep the start date's day, clamp to short
+    months.
+    """
+    first = np.datetime64(rule.next_run_date.date(), "D")
+    last = horizon_end
+    if rule.end_date is not None:
+        last = min(last, np.datetime64(rule.end_date.date(), "D"))
+    if first > last:
+        return np.empty(0, dtype="datetime64[D]")
+
+    freq = getattr(rule.frequency, "value", rule.frequency)
+    if freq in _DAY_STEP:
+        return np.arange(first, last + 1, _DAY_STEP[freq])
+
+    step = _MONTH_STEP[freq]
+    base = first.astype("datetime64[M]")
+    count = (last.astype("datetime64[M]") - base).astype(int) // step + 1
+    months = base + np.arange(count) * step
+    month_days = (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+    clamped = np.minimum(rule.start_date.day, month_days.astype(int)) - 1
+    days = months.astype("datetime64[D]") + clamped
+    days[0] = first
+    return days[days <= last]
+
+
+# ── Projection ────────────────────────────────────────────
+def project_balances(
+    balances: Dict[int, float],
+    rules: Sequence[RecurringTransaction],
+    today: date,
+    horizon_end: date,
+) -> List[ForecastSeries]:
+    """
+    Daily projected closing balance per account from `today` through
+    `horizon_end`. Occurrences land in one (accounts × days) delta grid
+    via bincount; a cumulative sum along the day axis gives balances.
+    Overdue occurrences the engine has not generated yet count today.
+    """
+    account_ids = sorted(balances)
+    row_of = {acct_id: i for i, acct_id in enumerate(account_ids)}
+    start = np.datetime64(today, "D")
+    end = np.datetime64(horizon_end, "D")
+    n_days = int((end - start).astype(int)) + 1
+
+    cells: List[np.ndarray] = []
+    amounts: List[np.ndarray] = []
+    for rule in rules:
+        row = row_of.get(rule.account_id)
+        if row is None:
+            continue
+        days = occurrence_days(rule, end)
+        if not len(days):
+            continue
+        offsets = np.clip((days - start).astype(int), 0, None)
+        cells.append(row * n_days + offsets)
+        amounts.append(
+            np.full(len(offsets), signed_amount(rule.direction, rule.amount))
+        )
+
+    grid = np.zeros(len(account_ids) * n_days)
+    if cells:
+        grid = np.bincount(
+            np.concatenate(cells),
+            weights=np.concatenate(amounts),
+            minlength=len(account_ids) * n_days,
+        )
+    opening = np.array([balances[a] for a in account_ids], dtype=float)
+    projected = opening[:, None] + np.cumsum(
+        grid.reshape(len(account_ids), n_days), axis=1
+    )
+
+    # ── First day below zero, per account ─────────────────
+    negative = projected < 0
+    first_negative = np.where(negative.any(axis=1), negative.argmax(axis=1), -1)
+
+    dates = (start + np.arange(n_days)).tolist()
+    out: List[ForecastSeries] = []
+    for i, acct_id in enumerate(account_ids):
+        neg_day: Optional[date] = (
+            dates[first_negative[i]] if first_negative[i] >= 0 else None
+        )
+        out.append(
+            ForecastSeries(
+                account_id=acct_id,
+                start_balance=balances[acct_id],
+                first_negative=neg_day,
+                points=[
+                    BalancePoint(date=d, balance=b)
+                    for d, b in zip(dates, projected[i].tolist())
+                ],
+            )
+        )
+    return out
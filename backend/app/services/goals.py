@@ -0,0 +1,61 @@
+# backend/app/services/goals.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import func, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Goal, GoalDeposit
+
+
+# ── Incremental maintenance ───────────────────────────────
+async def apply_goal_delta(
+    session: AsyncSession,
+    user_id: int,
+    goal_id: int,
+    amount: float,
+    count: int,
+    last_at: Optional[datetime],
+) -> Optional[float]:
+    """
+    Add `amount` and `count` deposits to a goal's totals in one UPDATE
+    (the row lock serialises concurrent deposits) and return the new
+    current_amount, or None when the goal is not owned by `user_id`.
+    """
+    last = Goal.last_deposit_at
+    if last_at is not None:
+        last = func.greatest(func.coalesce(Goal.last_deposit_at, last_at), last_at)
+    stmt = (
+        update(Goal)
+        .where(Goal.goal_id == goal_id, Goal.user_id == user_id)
+        .values(
+            current_amount=Goal.current_amount + amount,
+            deposit_count=Goal.deposit_count + count,
+            last_deposit_at=last,
+            updated_at=datetime.utcnow(),
+        )
+        .returning(Goal.current_amount)
+    )
+    return (await session.exec(stmt)).scalar_one_or_none()
+
+
+# ── Backfill ──────────────────────────────────────────────
+async def rebuild_goal_totals(
+    session: AsyncSession, user_id: Optional[int] = None
+) -> int:
+    """
+    Recompute every goal's totals from goal_deposit, for one user or
+    everyone. Returns the number of goals updated.
+    """
+    deposits = select(GoalDeposit).where(GoalDeposit.goal_id == Goal.goal_id)
+    total = deposits.with_only_columns(func.coalesce(func.sum(GoalDeposit.amount), 0))
+    count = deposits.with_only_columns(func.count())
+    last_at = deposits.with_only_columns(func.max(GoalDeposit.date))
+    stmt = update(Goal).values(
+        current_amount=total.scalar_subquery(),
+        deposit_count=count.scalar_subquery(),
+        last_deposit_at=last_at.scalar_subquery(),
+    )
+    if user_id is not None:
+        stmt = stmt.where(Goal.user_id == user_id)
+    result = await session.exec(stmt)
+    await session.commit()
+    return result.rowcount
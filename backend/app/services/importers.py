@@ -0,0 +1,130 @@
+# backend/app/services/importers.py
+import csv
+import io
+import re
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, Tuple
+
+# ── Row stream type: (1-based source row, raw fields) ──────
+RawRow = Tuple[int, Dict[str, Any]]
+
+
+class ImportFileError(ValueError):
+    """
+    The file stopped being readable at `row` (bad encoding, malformed
+    CSV). Rows before it were yielded normally; none after it can be.
+    """
+
+    def __init__(self, row: int, message: str) -> None:
+        super().__init__(message)
+        self.row = row
+        self.message = message
+
+
+# ── CSV ───────────────────────────────────────────────────
+def iter_csv_rows(fileobj: BinaryIO) -> Iterator[RawRow]:
+    """
+    Lazily yield rows from a CSV with a header line. Recognised columns:
+    title, description, amount, direction (or type), date, account_id.
+    A signed amount without a direction is read as deposit (+) or
+    withdrawal (-). Undecodable or malformed input raises
+    ImportFileError at the line where reading stopped.
+    """
+    reader = csv.DictReader(_decode_lines(fileobj))
+    try:
+        for row in reader:
+            fields = {_clean_key(k): _clean_value(v) for k, v in row.items()}
+            if "type" in fields and "direction" not in fields:
+                fields["direction"] = fields.pop("type")
+            _normalise_signed_amount(fields)
+            yield reader.line_num, fields
+    except UnicodeDecodeError as exc:
+        # line_num has not counted the failing line yet
+        raise ImportFileError(reader.line_num + 1, "File is not valid UTF-8") from exc
+    except csv.Error as exc:
+        raise ImportFileError(reader.line_num + 1, f"Malformed CSV: {exc}") from exc
+
+
+def _decode_lines(fileobj: BinaryIO) -> Iterator[str]:
+    # Line by line, so a bad byte is pinned to its own line instead of
+    # failing the first 8 KiB read
+    for line_no, raw in enumerate(fileobj):
+        yield raw.decode("utf-8-sig" if line_no == 0 else "utf-8")
+
+
+# ── OFX ───────────────────────────────────────────────────
+_OFX_TAG = re.compile(r"<([A-Z0-9.]+)>([^<\r\n]*)")
+
+
+def iter_ofx_rows(fileobj: BinaryIO) -> Iterator[RawRow]:
+    """
+    Lazily yield <STMTTRN> entries from an OFX 1.x (SGML) or 2.x (XML)
+    statement, one line at a time. Only DTPOSTED, TRNAMT, NAME and MEMO
+    are used; the target account comes from the request.
+    """
+    text = io.TextIOWrapper(fileobj, encoding="utf-8", errors="replace")
+    current: Dict[str, str] = {}
+    start_line = 0
+    in_txn = False
+    for line_no, line in enumerate(text, start=1):
+        upper = line.upper()
+        if "<STMTTRN>" in upper:
+            in_txn, current, start_line = True, {}, line_no
+        if in_txn:
+            for tag, value in _OFX_TAG.findall(line):
+                if value.strip():
+                    current[tag.upper()] = value.strip()
+        if in_txn and "</STMTTRN>" in upper:
+            in_txn = False
+            yield start_line, _ofx_to_fields(current)
+
+
+def _ofx_to_fields(txn: Dict[str, str]) -> Dict[str, Any]:
+    name = txn.get("NAME") or txn.get("PAYEE") or txn.get("MEMO") or "Imported"
+    fields: Dict[str, Any] = {
+        "title": name,
+        "description": txn.get("MEMO"),
+        "amount": txn.get("TRNAMT"),
+        "date": _parse_ofx_date(txn.get("DTPOSTED")),
+    }
+    _normalise_signed_amount(fields)
+    return fields
+
+
+def _parse_ofx_date(value: Any) -> Any:
+    # YYYYMMDD[HHMMSS[.XXX]][[TZ]] — keep the local part only
+    if not value:
+        return None
+    digits = re.match(r"\d+", value)
+    if not digits:
+        return value
+    stamp = digits.group(0)
+    try:
+        if len(stamp) >= 14:
+            return datetime.strptime(stamp[:14], "%Y%m%d%H%M%S")
+        return datetime.strptime(stamp[:8], "%Y%m%d")
+    except ValueError:
+        return value
+
+
+# ── Shared helpers ────────────────────────────────────────
+def _clean_key(key: Any) -> str:
+    return (key or "").strip().lower()
+
+
+def _clean_value(value: Any) -> Any:
+    # blank cells become None so optional fields fall back to defaults
+    return (value.strip() or None) if isinstance(value, str) else value
+
+
+def _normalise_signed_amount(fields: Dict[str, Any]) -> None:
+    raw = fields.get("amount")
+    if raw in (None, ""):
+        return
+    try:
+        amount = float(str(raw).replace(",", ""))
+    except ValueError:
+        return  # left for schema validation to report
+    if not fields.get("direction"):
+        fields["direction"] = "withdrawal" if amount < 0 else "deposit"
+    fields["amount"] = abs(amount)
@@ -0,0 +1,51 @@
+# backend/app/services/ledger.py
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import case, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Account, Transaction
+
+
+# ── Signed effect of a transaction on its account ─────────
+def signed_amount(direction: str, amount: float) -> float:
+    return amount if direction == "deposit" else -amount
+
+
+# SQL twin of signed_amount, for aggregates over the ledger
+SIGNED_AMOUNT = case(
+    (Transaction.direction == "deposit", Transaction.amount),
+    else_=-Transaction.amount,
+)
+
+
+def add_delta(deltas: Dict[int, float], account_id: int, delta: float) -> None:
+    deltas[account_id] = deltas.get(account_id, 0.0) + delta
+
+
+# ── Atomic balance maintenance ────────────────────────────
+async def apply_balance_deltas(
+    session: AsyncSession,
+    user_id: int,
+    deltas: Dict[int, float],
+    now: Optional[datetime] = None,
+) -> Dict[int, float]:
+    """
+    Apply `balance = balance + delta` per account in one UPDATE each and
+    return the new balances. Accounts are touched in ascending id order
+    so concurrent writers always take row locks in the same order.
+    Accounts not owned by `user_id` are skipped and missing from the
+    result, which callers treat as an invalid account.
+    """
+    now = now or datetime.utcnow()
+    balances: Dict[int, float] = {}
+    for account_id in sorted(deltas):
+        stmt = (
+            update(Account)
+            .where(Account.account_id == account_id, Account.user_id == user_id)
+            .values(balance=Account.balance + deltas[account_id], updated_at=now)
+            .returning(Account.balance)
+        )
+        new_balance = (await session.exec(stmt)).scalar_one_or_none()
+        if new_balance is not None:
+            balances[account_id] = new_balance
+    return balances
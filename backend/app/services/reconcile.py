@@ -0,0 +1,139 @@
+# backend/app/services/reconcile.py
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+from pydantic import BaseModel
+from sqlalchemy import func, select, union, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.config import RECONCILE_HIGH_WATER_MARGIN_SECONDS
+from app.models import Account, ReconcileState, Transaction
+from app.services.ledger import SIGNED_AMOUNT
+from app.services.versions import ACCOUNTS, bump_versions_for
+
+JOB_NAME = "account_balance"
+DRIFT_TOLERANCE = 0.005
+
+
+# ── Report models ─────────────────────────────────────────
+class AccountDrift(BaseModel):
+    account_id: int
+    user_id: int
+    stored: float
+    expected: float
+
+    @property
+    def drift(self) -> float:
+        return self.stored - self.expected
+
+
+class ReconcileReport(BaseModel):
+    started_at: datetime
+    full: bool
+    checked: int = 0
+    fixed: int = 0
+    drifted: List[AccountDrift] = []
+
+
+async def _expected_balances(
+    session: AsyncSession, account_ids: Sequence[int]
+) -> List[AccountDrift]:
+    # One grouped aggregate: opening balance + signed ledger sum
+    stmt = (
+        select(
+            Account.account_id,
+            Account.user_id,
+            Account.balance,
+            Account.opening_balance + func.coalesce(func.sum(SIGNED_AMOUNT), 0.0),
+        )
+        .outerjoin(Transaction, Transaction.account_id == Account.account_id)
+        .where(Account.account_id.in_(account_ids))
+        .group_by(Account.account_id)
+    )
+    rows = (await session.exec(stmt)).all()
+    return [
+        AccountDrift(account_id=a, user_id=u, stored=b, expected=e)
+        for a, u, b, e in rows
+    ]
+
+
+async def _changed_accounts(
+    session: AsyncSession, state: Optional[ReconcileState]
+) -> List[int]:
+    if state is None:
+        stmt = select(Account.account_id).order_by(Account.account_id)
+        return list((await session.exec(stmt)).scalars().all())
+    touched_tx = select(Transaction.account_id).where(
+        (Transaction.updated_at > state.high_water)
+        | (Transaction.transaction_id > state.last_transaction_id)
+    )
+    touched_acct = select(Account.account_id).where(
+        Account.updated_at > state.high_water
+    )
+    stmt = union(touched_tx, touched_acct)
+    return sorted((await session.exec(stmt)).scalars().all())
+
+
+# ── Engine ────────────────────────────────────────────────
+async def reconcile_balances(
+    session: AsyncSession,
+    *,
+    fix: bool = False,
+    full: bool = False,
+    batch_size: int = 500,
+) -> ReconcileReport:
+    """
+    Recompute Account.balance from the ledger for every account touched
+    since the last run (or all accounts with `full`), report drift and,
+    with `fix`, overwrite the stored balance. Batches commit separately;
+    the high-water mark advances once the run succeeds, unless drift was
+    found and left unfixed, so the next run looks at those accounts again.
+    The mark trails the run's start by RECONCILE_HIGH_WATER_MARGIN_SECONDS:
+    writers stamp updated_at before they commit, so a row stamped just
+    before `started` may only have become visible after this run read.
+    """
+    started = datetime.utcnow()
+    state = await session.get(ReconcileState, JOB_NAME)
+    max_tx_id = await session.scalar(select(func.max(Transaction.transaction_id)))
+    account_ids = await _changed_accounts(session, None if full else state)
+    report = ReconcileReport(started_at=started, full=full or state is None)
+
+    for i in range(0, len(account_ids), batch_size):
+        batch = account_ids[i : i + batch_size]
+        if fix:
+            # Lock in id order, same as apply_balance_deltas
+            await session.exec(
+                select(Account.account_id)
+                .where(Account.account_id.in_(batch))
+                .order_by(Account.account_id)
+                .with_for_update()
+            )
+        results = await _expected_balances(session, batch)
+        report.checked += len(results)
+        fixed_users = set()
+        for r in results:
+            if abs(r.drift) <= DRIFT_TOLERANCE:
+                continue
+            report.drifted.append(r)
+            if fix:
+                await session.exec(
+                    update(Account)
+                    .where(Account.account_id == r.account_id)
+                    .values(balance=r.expected)
+                )
+                fixed_users.add(r.user_id)
+                report.fixed += 1
+        await bump_versions_for(session, fixed_users, ACCOUNTS)
+        await session.commit()  # release batch locks
+
+    # ── Report-only runs with drift keep the old mark ──────
+    if report.drifted and not fix:
+        return report
+
+    state = await session.get(ReconcileState, JOB_NAME)
+    if state is None:
+        state = ReconcileState(job=JOB_NAME, high_water=started)
+    state.high_water = started - timedelta(seconds=RECONCILE_HIGH_WATER_MARGIN_SECONDS)
+    state.last_transaction_id = max_tx_id or 0
+    state.updated_at = datetime.utcnow()
+    session.add(state)
+    await session.commit()
+    return report
@@ -0,0 +1,311 @@
+# backend/app/services/recurring.py
+import calendar
+import heapq
+import logging
+from datetime import datetime, timedelta
+from itertools import islice, takewhile
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from pydantic import BaseModel
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db import async_session
+from app.models import Account, RecurringTransaction, Transaction
+from app.services.ledger import add_delta, apply_balance_deltas, signed_amount
+from app.services.rollups import RollupDeltas, add_rollup, apply_rollup_deltas
+from app.services.scheduler import DueTimer, run_as_leader
+from app.services.versions import ACCOUNTS, RECURRING, TRANSACTIONS, bump_versions_for
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "recurring"
+CHUNK_SIZE = 500
+INSERT_BATCH_SIZE = 1000
+# Occurrences generated per rule and run; a rule that is further behind
+# carries on from its advanced next_run_date on the following run
+CATCH_UP_LIMIT = 1000
+
+
+# ── Date stepping with month-end clamping ─────────────────
+def add_months(at: datetime, months: int, anchor_day: int) -> datetime:
+    index = at.month - 1 + months
+    year, month = at.year + index // 12, index % 12 + 1
+    day = min(anchor_day, calendar.monthrange(year, month)[1])
+    return at.replace(year=year, month=month, day=day)
+
+
+def advance(at: datetime, frequency: str, anchor_day: int) -> datetime:
+    """
+    Next occurrence after `at`. Monthly and yearly rules keep their
+    `anchor_day` (the start date's day), clamped to short months, so a
+    rule starting Jan 31 runs Feb 28 and then Mar 31.
+    """
+    freq = getattr(frequency, "value", frequency)
+    if freq == "daily":
+        return at + timedelta(days=1)
+    if freq == "weekly":
+        return at + timedelta(weeks=1)
+    if freq == "monthly":
+        return add_months(at, 1, anchor_day)
+    return add_months(at, 12, anchor_day)
+
+
+def _skip_towards(
+    at: datetime, frequency: str, anchor_day: int, start: datetime
+) -> datetime:
+    # Jump whole periods to just before `start` without stepping each one
+    freq = getattr(frequency, "value", frequency)
+    if freq in ("daily", "weekly"):
+        step = timedelta(days=1 if freq == "daily" else 7)
+        return at + ((start - at) // step) * step
+    step = 1 if freq == "monthly" else 12
+    months = (start.year - at.year) * 12 + start.month - at.month
+    periods = months // step - 1
+    return add_months(at, periods * step, anchor_day) if periods > 0 else at
+
+
+def iter_occurrences(
+    rule: RecurringTransaction, start: Optional[datetime] = None
+) -> Iterator[datetime]:
+    """
+    Lazily yield the rule's pending occurrences, from next_run_date
+    until end_date (forever if open-ended), skipping any before `start`.
+    """
+    at, anchor_day = rule.next_run_date, rule.start_date.day
+    if start is not None and start > at:
+        at = _skip_towards(at, rule.frequency, anchor_day, start)
+    while rule.end_date is None or at <= rule.end_date:
+        if start is None or at >= start:
+            yield at
+        at = advance(at, rule.frequency, anchor_day)
+
+
+def due_occurrences(
+    rule: RecurringTransaction, now: datetime
+) -> Tuple[List[datetime], datetime]:
+    """Missed occurrences up to `now` and the next_run_date after them."""
+    due = takewhile(lambda at: at <= now, iter_occurrences(rule))
+    dates = list(islice(due, CATCH_UP_LIMIT))
+    if not dates:
+        return dates, rule.next_run_date
+    return dates, advance(dates[-1], rule.frequency, rule.start_date.day)
+
+
+def merge_occurrences(
+    rules: Sequence[RecurringTransaction], start: datetime, end: datetime
+) -> Iterator[Tuple[datetime, RecurringTransaction]]:
+    """
+    All rules' occurrences in [start, end] in date order. A heap merges
+    the per-rule generators, so only the window is ever materialised.
+    """
+    by_id = {rule.recurring_id: rule for rule in rules}
+    streams = [_tagged(rule, start) for rule in rules]
+    for at, rec_id in takewhile(lambda o: o[0] <= end, heapq.merge(*streams)):
+        yield at, by_id[rec_id]
+
+
+def _tagged(
+    rule: RecurringTransaction, start: datetime
+) -> Iterator[Tuple[datetime, int]]:
+    # (date, id) pairs order ties by rule id and never compare rules
+    for at in iter_occurrences(rule, start):
+        yield at, rule.recurring_id
+
+
+# ── Report ────────────────────────────────────────────────
+class RecurringRunReport(BaseModel):
+    started_at: datetime
+    rules: int = 0
+    generated: int = 0
+    skipped: int = 0
+
+
+def _occurrence_row(rule: RecurringTransaction, at: datetime, now: datetime) -> Dict:
+    freq = getattr(rule.frequency, "value", rule.frequency)
+    return {
+        "user_id": rule.user_id,
+        "account_id": rule.account_id,
+        "recurring_id": rule.recurring_id,
+        "occurrence_date": at,
+        "date": at,
+        "title": rule.title or "Recurring",
+        "description": rule.description or f"Recurring ({freq})",
+        "amount": rule.amount,
+        "direction": rule.direction,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def _process_chunk(
+    session: AsyncSession,
+    rules: Sequence[RecurringTransaction],
+    now: datetime,
+    orphaned: Sequence[RecurringTransaction] = (),
+) -> int:
+    """
+    Generate and advance `rules`. `orphaned` rules point at an account
+    their owner does not hold: they are advanced past their due
+    occurrences without generating any, and each skip is logged.
+    """
+    rows: List[Dict] = []
+    advanced: List[Dict] = []
+    for rule in rules:
+        dates, next_run = due_occurrences(rule, now)
+        rows.extend(_occurrence_row(rule, at, now) for at in dates)
+        advanced.append({"rid": rule.recurring_id, "next_run": next_run})
+    for rule in orphaned:
+        dates, next_run = due_occurrences(rule, now)
+        logger.warning(
+            "Recurring rule %d skipped %d occurrence(s): account %d is not "
+            "owned by user %d",
+            rule.recurring_id,
+            len(dates),
+            rule.account_id,
+            rule.user_id,
+        )
+        advanced.append({"rid": rule.recurring_id, "next_run": next_run})
+
+    # ── Multi-row INSERTs; occurrences already present are skipped ─
+    inserted = []
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        stmt = (
+            pg_insert(Transaction)
+            .values(rows[i : i + INSERT_BATCH_SIZE])
+            .on_conflict_do_nothing(index_elements=["recurring_id", "occurrence_date"])
+            .returning(
+                Transaction.user_id,
+                Transaction.account_id,
+                Transaction.date,
+                Transaction.direction,
+                Transaction.amount,
+            )
+        )
+        inserted.extend((await session.exec(stmt)).all())
+
+    # ── One aggregated balance delta per touched account ───
+    deltas: Dict[int, Dict[int, float]] = {}
+    rollups: Dict[int, RollupDeltas] = {}
+    for user_id, account_id, at, direction, amount in inserted:
+        add_delta(
+            deltas.setdefault(user_id, {}), account_id, signed_amount(direction, amount)
+        )
+        add_rollup(rollups.setdefault(user_id, {}), account_id, at, direction, amount)
+    for user_id in sorted(deltas):
+        await apply_balance_deltas(session, user_id, deltas[user_id], now)
+        await apply_rollup_deltas(session, user_id, rollups[user_id])
+
+    # ── Advance every rule in one executemany UPDATE ───────
+    table = RecurringTransaction.__table__
+    await session.exec(
+        update(table)
+        .where(table.c.recurring_id == bindparam("rid"))
+        .values(next_run_date=bindparam("next_run"), updated_at=now),
+        params=advanced,
+    )
+
+    rule_users: Set[int] = {rule.user_id for rule in [*rules, *orphaned]}
+    await bump_versions_for(session, rule_users, RECURRING)
+    await bump_versions_for(session, deltas.keys(), TRANSACTIONS, ACCOUNTS)
+    await session.commit()
+    return len(inserted)
+
+
+# ── Engine ────────────────────────────────────────────────
+# Rules that can still fire (matches ix_recurring_transaction_active_next_run)
+ACTIVE_RULE = or_(
+    RecurringTransaction.end_date.is_(None),
+    RecurringTransaction.next_run_date <= RecurringTransaction.end_date,
+)
+
+
+async def run_due_recurring(
+    session: AsyncSession,
+    now: datetime = None,
+    chunk_size: int = CHUNK_SIZE,
+    recurring_ids: Optional[Sequence[int]] = None,
+) -> RecurringRunReport:
+    """
+    Generate every missed occurrence of every due rule (or only of
+    `recurring_ids`), walking rules in recurring_id order `chunk_size`
+    at a time; each chunk commits on its own. Rules locked by a
+    concurrent edit are skipped until the next run. Rules whose account
+    no longer belongs to their owner are advanced without generating
+    anything, and the skip is logged. Safe to rerun: occurrences are
+    unique per rule and date.
+    """
+    now = now or datetime.utcnow()
+    report = RecurringRunReport(started_at=now)
+    last_id = 0
+    while True:
+        # The account must belong to the rule's owner; a NULL here means
+        # it does not, and the rule must not write into someone else's
+        stmt = (
+            select(RecurringTransaction, Account.account_id)
+            .outerjoin(
+                Account,
+                (Account.account_id == RecurringTransaction.account_id)
+                & (Account.user_id == RecurringTransaction.user_id),
+            )
+            .where(
+                RecurringTransaction.recurring_id > last_id,
+                RecurringTransaction.next_run_date <= now,
+                ACTIVE_RULE,
+            )
+            .order_by(RecurringTransaction.recurring_id)
+            .limit(chunk_size)
+            .with_for_update(of=RecurringTransaction, skip_locked=True)
+        )
+        if recurring_ids is not None:
+            stmt = stmt.where(RecurringTransaction.recurring_id.in_(recurring_ids))
+        rows = (await session.exec(stmt)).all()
+        if not rows:
+            break
+        last_id = rows[-1][0].recurring_id
+        rules = [rule for rule, owned in rows if owned is not None]
+        orphaned = [rule for rule, owned in rows if owned is None]
+        report.rules += len(rules)
+        report.skipped += len(orphaned)
+        report.generated += await _process_chunk(session, rules, now, orphaned)
+    return report
+
+
+# ── In-process timer: fire rules exactly when due ─────────
+async def _load_schedule(until: datetime) -> Dict[int, datetime]:
+    async with async_session() as session:
+        rows = await session.exec(
+            select(
+                RecurringTransaction.recurring_id, RecurringTransaction.next_run_date
+            ).where(RecurringTransaction.next_run_date <= until, ACTIVE_RULE)
+        )
+        return dict(rows.all())
+
+
+async def _fire_due(
+    recurring_ids: List[int],
+) -> Optional[Dict[int, Optional[datetime]]]:
+    async def run() -> int:
+        async with async_session() as session:
+            report = await run_due_recurring(session, recurring_ids=recurring_ids)
+        return report.generated
+
+    if await run_as_leader(JOB_NAME, run) is None:
+        return None
+    # ── Reschedule from the advanced next_run_date ─────────
+    async with async_session() as session:
+        rows = await session.exec(
+            select(
+                RecurringTransaction.recurring_id, RecurringTransaction.next_run_date
+            ).where(RecurringTransaction.recurring_id.in_(recurring_ids), ACTIVE_RULE)
+        )
+        upcoming = dict(rows.all())
+    return {rid: upcoming.get(rid) for rid in recurring_ids}
+
+
+recurring_timer = DueTimer(_fire_due, _load_schedule)
+
+
+def schedule_rule(rule: RecurringTransaction) -> None:
+    """Refresh one rule's timer entry after it was created or edited."""
+    active = rule.end_date is None or rule.next_run_date <= rule.end_date
+    recurring_timer.schedule(rule.recurring_id, rule.next_run_date if active else None)
@@ -0,0 +1,113 @@
+# backend/app/services/rollups.py
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import MonthlyRollup, Transaction
+
+# ── (account_id, year_month, direction) -> (amount, count) ─
+RollupKey = Tuple[int, str, str]
+RollupDeltas = Dict[RollupKey, Tuple[float, int]]
+
+
+def month_key(at: datetime) -> str:
+    return at.strftime("%Y-%m")
+
+
+def add_rollup(
+    deltas: RollupDeltas,
+    account_id: int,
+    at: datetime,
+    direction: str,
+    amount: float,
+    sign: int = 1,
+) -> None:
+    """
+    Record one transaction entering (`sign=1`) or leaving (`sign=-1`)
+    its monthly bucket.
+    """
+    key = (account_id, month_key(at), getattr(direction, "value", direction))
+    total, count = deltas.get(key, (0.0, 0))
+    deltas[key] = (total + sign * amount, count + sign)
+
+
+# ── Incremental maintenance ───────────────────────────────
+async def apply_rollup_deltas(
+    session: AsyncSession, user_id: int, deltas: RollupDeltas
+) -> None:
+    """
+    Upsert all buckets in one INSERT ... ON CONFLICT DO UPDATE, in key
+    order so concurrent writers lock buckets consistently, then drop
+    buckets that lost their last transaction.
+    """
+    rows = [
+        {
+            "user_id": user_id,
+            "account_id": account_id,
+            "year_month": year_month,
+            "direction": direction,
+            "total": total,
+            "count": count,
+        }
+        for (account_id, year_month, direction), (total, count) in sorted(
+            deltas.items()
+        )
+        if count or total
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(MonthlyRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "account_id", "year_month", "direction"],
+        set_={
+            "total": MonthlyRollup.total + stmt.excluded.total,
+            "count": MonthlyRollup.count + stmt.excluded.count,
+        },
+    )
+    await session.exec(stmt)
+
+    shrunk = [key for key, (_, count) in sorted(deltas.items()) if count < 0]
+    if shrunk:
+        await session.exec(
+            delete(MonthlyRollup).where(
+                MonthlyRollup.user_id == user_id,
+                tuple_(
+                    MonthlyRollup.account_id,
+                    MonthlyRollup.year_month,
+                    MonthlyRollup.direction,
+                ).in_(shrunk),
+                MonthlyRollup.count <= 0,
+            )
+        )
+
+
+# ── Backfill ──────────────────────────────────────────────
+async def rebuild_rollups(session: AsyncSession, user_id: Optional[int] = None) -> int:
+    """
+    Recompute rollups from the transaction table with one grouped
+    INSERT ... SELECT, for one user or everyone. Returns bucket count.
+    """
+    ym = func.to_char(Transaction.date, "YYYY-MM")
+    src = select(
+        Transaction.user_id,
+        Transaction.account_id,
+        ym,
+        Transaction.direction,
+        func.sum(Transaction.amount),
+        func.count(),
+    ).group_by(Transaction.user_id, Transaction.account_id, ym, Transaction.direction)
+    wipe = delete(MonthlyRollup)
+    if user_id is not None:
+        src = src.where(Transaction.user_id == user_id)
+        wipe = wipe.where(MonthlyRollup.user_id == user_id)
+
+    await session.exec(wipe)
+    result = await session.exec(
+        insert(MonthlyRollup).from_select(
+            ["user_id", "account_id", "year_month", "direction", "total", "count"],
+            src,
+        )
+    )
+    await session.commit()
+    return result.rowcount
@@ -0,0 +1,285 @@
+# backend/app/services/scheduler.py
+import asyncio
+import heapq
+import logging
+import os
+import socket
+import time
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from sqlalchemy import func, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.config import SCHEDULER_LEASE_SECONDS, SCHEDULER_RESYNC_SECONDS
+from app.db import async_session
+from app.models import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process as a lease holder
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _db_now():
+    # DB clock in UTC, so workers with skewed clocks agree on expiry
+    return func.timezone("utc", func.now())
+
+
+# ── Status model ──────────────────────────────────────────
+class SchedulerStatus(BaseModel):
+    """
+    Public view of a job's last run. Holder identity and error text stay
+    in the scheduler_lease table and the logs.
+    """
+
+    job: str
+    last_run_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    last_rows: Optional[int] = Field(None, description="Rows the last run generated")
+    ok: Optional[bool] = Field(None, description="Last run succeeded; null if none yet")
+
+
+# ── Lease ─────────────────────────────────────────────────
+async def acquire_lease(
+    session: AsyncSession, job: str, ttl: int = SCHEDULER_LEASE_SECONDS
+) -> bool:
+    """
+    Take or renew the lease for `job` in one upsert. It succeeds when
+    the row is new, expired, or already ours; row locking makes
+    concurrent callers see exactly one winner.
+    """
+    stmt = pg_insert(SchedulerLease).values(
+        job=job, holder=WORKER_ID, expires_at=_db_now() + timedelta(seconds=ttl)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["job"],
+        set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+        where=or_(
+            SchedulerLease.expires_at < _db_now(),
+            SchedulerLease.holder == WORKER_ID,
+        ),
+    ).returning(SchedulerLease.holder)
+    holder = (await session.exec(stmt)).scalar_one_or_none()
+    await session.commit()
+    return holder == WORKER_ID
+
+
+async def _keep_lease(job: str, ttl: int) -> None:
+    # Renew well before expiry while a long run is in progress
+    while True:
+        await asyncio.sleep(ttl / 3)
+        async with async_session() as session:
+            await acquire_lease(session, job, ttl)
+
+
+async def _record_run(
+    job: str, started: datetime, duration_ms: float, rows: int, error: Optional[str]
+) -> None:
+    async with async_session() as session:
+        await session.exec(
+            update(SchedulerLease)
+            .where(SchedulerLease.job == job)
+            .values(
+                last_run_at=started,
+                last_duration_ms=duration_ms,
+                last_rows=rows,
+                last_error=error,
+            )
+        )
+        # Hand the lease back, so the next due key fires on whichever
+        # worker's timer holds it rather than waiting for this one
+        await session.exec(
+            update(SchedulerLease)
+            .where(SchedulerLease.job == job, SchedulerLease.holder == WORKER_ID)
+            .values(expires_at=_db_now())
+        )
+        await session.commit()
+
+
+# ── Leader-only execution ─────────────────────────────────
+async def run_as_leader(
+    job: str,
+    fn: Callable[[], Awaitable[int]],
+    ttl: int = SCHEDULER_LEASE_SECONDS,
+) -> Optional[int]:
+    """
+    Run `fn` only if this worker can take the lease for `job`; other
+    workers skip while a run is in progress. The lease is released when
+    the run ends, and lapses on its own if the worker dies mid-run, so
+    `fn` must be safe to repeat. Returns the rows `fn` reported, or None
+    when skipped.
+    """
+    async with async_session() as session:
+        if not await acquire_lease(session, job, ttl):
+            return None
+
+    keeper = asyncio.create_task(_keep_lease(job, ttl))
+    started = datetime.utcnow()
+    clock = time.perf_counter()
+    rows, error = 0, None
+    try:
+        rows = await fn()
+        return rows
+    except Exception as exc:
+        error = repr(exc)
+        raise
+    finally:
+        keeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await keeper  # no renewal may land after the release
+        duration_ms = (time.perf_counter() - clock) * 1000
+        await _record_run(job, started, duration_ms, rows, error)
+
+
+async def scheduler_status(session: AsyncSession, job: str) -> SchedulerStatus:
+    lease = await session.get(SchedulerLease, job)
+    if lease is None or lease.last_run_at is None:
+        return SchedulerStatus(job=job)
+    return SchedulerStatus(
+        job=job,
+        last_run_at=lease.last_run_at,
+        last_duration_ms=lease.last_duration_ms,
+        last_rows=lease.last_rows,
+        ok=lease.last_error is None,
+    )
+
+
+# ── Precise timer over due dates ──────────────────────────
+# fire(keys) -> new due date per key (None drops it), or None if skipped
+FireFn = Callable[[List[int]], Awaitable[Optional[Dict[int, Optional[datetime]]]]]
+# load(until) -> due date of every key due by `until`
+LoadFn = Callable[[datetime], Awaitable[Dict[int, datetime]]]
+
+
+class DueTimer:
+    """
+    Min-heap of (due_at, key) that sleeps until the earliest entry is
+    due and hands every key due by then to `fire` as one batch. Updates
+    push a fresh pair; superseded pairs are skipped when they surface.
+    On start and every `resync_seconds` the heap is reloaded with the
+    keys due within two resync intervals, so later keys are picked up
+    by a later resync. A failed reload is logged and retried with
+    exponential backoff from `backoff_seconds` up to `resync_seconds`.
+    """
+
+    def __init__(
+        self,
+        fire: FireFn,
+        load: LoadFn,
+        resync_seconds: int = SCHEDULER_RESYNC_SECONDS,
+        retry_seconds: int = 30,
+        backoff_seconds: float = 1.0,
+    ) -> None:
+        self.fire = fire
+        self.load = load
+        self.resync_seconds = resync_seconds
+        self.retry_seconds = retry_seconds
+        self.backoff_seconds = backoff_seconds
+        self._heap: List[Tuple[datetime, int]] = []
+        self._due: Dict[int, datetime] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ── Incremental updates ──────────────────────────────
+    def schedule(self, key: int, due_at: Optional[datetime]) -> None:
+        if due_at is None:
+            self.remove(key)
+            return
+        self._due[key] = due_at
+        heapq.heappush(self._heap, (due_at, key))
+        if self._heap[0] == (due_at, key):
+            self._wake.set()  # new earliest entry: re-arm the sleep
+
+    def remove(self, key: int) -> None:
+        self._due.pop(key, None)
+
+    async def rebuild(self) -> None:
+        # Anything due later is loaded by a resync before it is due
+        until = datetime.utcnow() + timedelta(seconds=2 * self.resync_seconds)
+        self._due = dict(await self.load(until))
+        self._heap = [(at, key) for key, at in self._due.items()]
+        heapq.heapify(self._heap)
+
+    # ── Lifecycle ────────────────────────────────────────
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self._task.add_done_callback(self._on_done)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        logger.error("Timer task stopped unexpectedly", exc_info=task.exception())
+        if self._task is task:
+            self._task = None  # let a later start() bring it back
+
+    def _sleep_seconds(self) -> float:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)  # superseded or removed
+        if not self._heap:
+            return float(self.resync_seconds)
+        wait = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+        return min(max(wait, 0.0), float(self.resync_seconds))
+
+    def _pop_due(self) -> List[int]:
+        now, keys = datetime.utcnow(), []
+        while self._heap and self._heap[0][0] <= now:
+            at, key = heapq.heappop(self._heap)
+            if self._due.get(key) == at:
+                del self._due[key]
+                keys.append(key)
+        return keys
+
+    async def _run(self) -> None:
+        backoff = 0.0
+        next_sync = time.monotonic()
+        while True:
+            if time.monotonic() >= next_sync:
+                try:
+                    await self.rebuild()
+                except Exception:
+                    backoff = min(
+                        max(backoff * 2, self.backoff_seconds), self.resync_seconds
+                    )
+                    logger.exception("Timer reload failed; retrying in %.1fs", backoff)
+                    next_sync = time.monotonic() + backoff
+                else:
+                    backoff = 0.0
+                    next_sync = time.monotonic() + self.resync_seconds
+            # Keys scheduled since keep firing while a reload is failing
+            wait = min(self._sleep_seconds(), max(next_sync - time.monotonic(), 0.0))
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            keys = self._pop_due()
+            if keys:
+                await self._fire(keys)
+
+    async def _fire(self, keys: List[int]) -> None:
+        try:
+            result = await self.fire(keys)
+        except Exception:
+            logger.exception("Timer batch of %d keys failed", len(keys))
+            result = None
+        # Not the leader, failed, or still due (row was locked): retry later
+        retry = datetime.utcnow() + timedelta(seconds=self.retry_seconds)
+        if result is None:
+            result = {key: retry for key in keys}
+        for key, at in result.items():
+            if key not in self._due:  # keep edits made while firing
+                self.schedule(
+                    key, at if at is None or at > datetime.utcnow() else retry
+                )
@@ -0,0 +1,88 @@
+# backend/app/services/versions.py
+import hashlib
+from typing import Iterable, Optional
+from fastapi import Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import EntityVersion
+
+# ── Entity names shared by writers and list endpoints ─────
+ACCOUNTS = "accounts"
+BUDGETS = "budgets"
+GOALS = "goals"
+RECURRING = "recurring"
+TRANSACTIONS = "transactions"
+
+
+# ── Writers: bump inside the same DB transaction ──────────
+async def bump_versions(session: AsyncSession, user_id: int, *entities: str) -> None:
+    """
+    Increment the version of each entity for `user_id`, creating the
+    counter on first use. Call before commit so the bump is atomic with
+    the write it describes.
+    """
+    await bump_versions_for(session, [user_id], *entities)
+
+
+async def bump_versions_for(
+    session: AsyncSession, user_ids: Iterable[int], *entities: str
+) -> None:
+    rows = [
+        {"user_id": uid, "entity": e, "version": 1}
+        for uid in sorted(set(user_ids))
+        for e in sorted(set(entities))
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(EntityVersion).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "entity"],
+        set_={"version": EntityVersion.version + 1},
+    )
+    await session.exec(stmt)
+
+
+# ── Readers: ETag / If-None-Match ─────────────────────────
+async def entity_version(session: AsyncSession, user_id: int, entity: str) -> int:
+    """Current version of `entity` for `user_id`; 0 before the first write."""
+    version = await session.scalar(
+        select(EntityVersion.version).where(
+            EntityVersion.user_id == user_id, EntityVersion.entity == entity
+        )
+    )
+    return version or 0
+
+
+def current_etag(user_id: int, entity: str, version: int, request: Request) -> str:
+    # Query params (page, filters, ...) select different representations
+    params = hashlib.sha1(str(request.url.query).encode()).hexdigest()[:12]
+    return f'W/"{user_id}-{entity}-{version}-{params}"'
+
+
+def _matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags or etag.removeprefix("W/") in tags
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    user_id: int,
+    entity: str,
+    version: int,
+) -> Optional[Response]:
+    """
+    Return a 304 when the client's If-None-Match still matches `version`
+    (from `entity_version`), so the handler can skip its list query;
+    otherwise stamp the ETag onto `response` and return None. Handlers
+    pass the same version to the read cache.
+    """
+    etag = current_etag(user_id, entity, version, request)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
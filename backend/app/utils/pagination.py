@@ -0,0 +1,28 @@
+# backend/app/utils/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from fastapi import HTTPException, status
+
+
+# ── Opaque keyset cursors ─────────────────────────────────
+def encode_cursor(at: datetime, row_id: int) -> str:
+    """
+    Pack the (date, id) sort key of the last row on a page into an
+    opaque, URL-safe token.
+    """
+    raw = json.dumps({"d": at.isoformat(), "id": row_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Unpack a token produced by `encode_cursor`, or raise 400.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["d"]), int(data["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid cursor")
@@ -0,0 +1,70 @@
+"""transaction hot-query indexes
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Composite indexes for the GET /transactions listing (user, optional
+account, date range, ORDER BY date DESC, transaction_id DESC) and a
+partial index for the recurring scheduler scan. Built CONCURRENTLY so
+large tables stay writable; IF NOT EXISTS because fresh databases get
+them from SQLModel.metadata.create_all on startup.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transaction_user_date_id",
+            "transaction",
+            ["user_id", sa.text("date DESC"), sa.text("transaction_id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transaction_user_account_date",
+            "transaction",
+            ["user_id", "account_id", sa.text("date DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_recurring_transaction_active_next_run",
+            "recurring_transaction",
+            ["next_run_date"],
+            postgresql_where=sa.text("end_date IS NULL OR next_run_date <= end_date"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_recurring_transaction_active_next_run",
+            table_name="recurring_transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_transaction_user_account_date",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_transaction_user_date_id",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,55 @@
+"""account opening balance and reconciliation state
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+Account.balance = opening_balance + signed ledger sum. Existing
+accounts get whatever part of their current balance the ledger does not
+explain, so the first reconcile run starts from zero drift.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: create_all on startup may have added it already
+    op.execute(
+        "ALTER TABLE account "
+        "ADD COLUMN IF NOT EXISTS opening_balance FLOAT NOT NULL DEFAULT 0"
+    )
+    op.execute(
+        """
+        UPDATE account a
+        SET opening_balance = a.balance - COALESCE(
+            (
+                SELECT SUM(CASE WHEN t.direction = 'deposit'
+                                THEN t.amount ELSE -t.amount END)
+                FROM transaction t
+                WHERE t.account_id = a.account_id
+            ),
+            0
+        )
+        """
+    )
+    op.create_table(
+        "reconcile_state",
+        sa.Column("job", sa.String(), primary_key=True),
+        sa.Column("high_water", sa.DateTime(), nullable=False),
+        sa.Column("last_transaction_id", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reconcile_state", if_exists=True)
+    op.drop_column("account", "opening_balance")
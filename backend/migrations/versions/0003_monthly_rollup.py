@@ -0,0 +1,53 @@
+"""monthly rollup table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+Per (user, account, month, direction) sums and counts, maintained by
+the transactions router and backfilled here from the ledger.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ENUM as PGEnum
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_rollup",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.user_id")),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("account.account_id")),
+        sa.Column("year_month", sa.String(), nullable=False),
+        sa.Column(
+            "direction",
+            PGEnum(name="transaction_direction", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("total", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "account_id", "year_month", "direction"),
+        if_not_exists=True,
+    )
+    op.execute(
+        """
+        INSERT INTO monthly_rollup
+            (user_id, account_id, year_month, direction, total, count)
+        SELECT user_id, account_id, to_char(date, 'YYYY-MM'), direction,
+               SUM(amount), COUNT(*)
+        FROM transaction
+        GROUP BY user_id, account_id, to_char(date, 'YYYY-MM'), direction
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_rollup", if_exists=True)
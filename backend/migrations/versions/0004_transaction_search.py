@@ -0,0 +1,67 @@
+"""transaction full-text and trigram search
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+Stored tsvector over title + description with a GIN index, plus a
+pg_trgm GIN index on title for fuzzy merchant matching.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        ALTER TABLE transaction
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english',
+                        coalesce(title, '') || ' ' || coalesce(description, ''))
+        ) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transaction_search_vector",
+            "transaction",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transaction_title_trgm",
+            "transaction",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_transaction_title_trgm",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_transaction_search_vector",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER TABLE transaction DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,68 @@
+"""budget periods and budget-transaction mapping
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+Budgets gain period / start_date / end_date; transactions gain an
+optional budget_id (SET NULL on budget delete) indexed with date for
+the budget-vs-actual aggregate.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DO $$ BEGIN
+            CREATE TYPE budget_period AS ENUM ('weekly', 'monthly', 'yearly');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE budget
+            ADD COLUMN IF NOT EXISTS period budget_period
+                NOT NULL DEFAULT 'monthly',
+            ADD COLUMN IF NOT EXISTS start_date TIMESTAMP,
+            ADD COLUMN IF NOT EXISTS end_date TIMESTAMP
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE transaction
+            ADD COLUMN IF NOT EXISTS budget_id INTEGER
+                REFERENCES budget (budget_id) ON DELETE SET NULL
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transaction_budget_date",
+            "transaction",
+            ["budget_id", "date"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_transaction_budget_date",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("transaction", "budget_id")
+    op.drop_column("budget", "end_date")
+    op.drop_column("budget", "start_date")
+    op.drop_column("budget", "period")
@@ -0,0 +1,34 @@
+"""per-user entity version counters
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+Bumped by every write path; list endpoints turn the version into an
+ETag and answer If-None-Match with 304 from this single-row lookup.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_version",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.user_id")),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "entity"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("entity_version", if_exists=True)
@@ -0,0 +1,37 @@
+"""scheduler lease table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+Workers race for a time-limited lease row per job; only the holder runs
+the tick. The same row records the last run for the status endpoint.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_lease",
+        sa.Column("job", sa.String(), primary_key=True),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_duration_ms", sa.Float(), nullable=True),
+        sa.Column("last_rows", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_lease", if_exists=True)
@@ -0,0 +1,51 @@
+"""link generated transactions to their recurring occurrence
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+Generated transactions record recurring_id and occurrence_date; the
+unique index lets the recurring engine insert with ON CONFLICT DO
+NOTHING, so a rerun or overlapping run never duplicates an occurrence.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE transaction
+            ADD COLUMN IF NOT EXISTS recurring_id INTEGER
+                REFERENCES recurring_transaction (recurring_id) ON DELETE SET NULL,
+            ADD COLUMN IF NOT EXISTS occurrence_date TIMESTAMP
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_transaction_recurring_occurrence",
+            "transaction",
+            ["recurring_id", "occurrence_date"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ux_transaction_recurring_occurrence",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("transaction", "occurrence_date")
+    op.drop_column("transaction", "recurring_id")
@@ -0,0 +1,50 @@
+"""denormalised goal deposit totals
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+Goals carry current_amount, deposit_count and last_deposit_at, kept up
+to date by the deposit endpoints, so listing goals no longer sums
+goal_deposit. Existing goals are backfilled here.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE goal
+            ADD COLUMN IF NOT EXISTS current_amount FLOAT NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS deposit_count INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS last_deposit_at TIMESTAMP
+        """
+    )
+    op.execute(
+        """
+        UPDATE goal g
+        SET current_amount = s.total,
+            deposit_count = s.n,
+            last_deposit_at = s.last_at
+        FROM (
+            SELECT goal_id, SUM(amount) AS total, COUNT(*) AS n, MAX(date) AS last_at
+            FROM goal_deposit
+            GROUP BY goal_id
+        ) s
+        WHERE g.goal_id = s.goal_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("goal", "last_deposit_at")
+    op.drop_column("goal", "deposit_count")
+    op.drop_column("goal", "current_amount")
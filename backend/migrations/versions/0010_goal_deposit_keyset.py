@@ -0,0 +1,41 @@
+"""goal deposit keyset index
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+
+Composite index behind GET /goals/{goal_id}/deposits, which pages a
+goal's history ordered by (date, deposit_id). Built CONCURRENTLY so
+deposits stay writable; IF NOT EXISTS because fresh databases get it
+from SQLModel.metadata.create_all on startup.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_goal_deposit_goal_date_id",
+            "goal_deposit",
+            ["goal_id", "date", "deposit_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_goal_deposit_goal_date_id",
+            table_name="goal_deposit",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,42 @@
+"""index transaction.updated_at for incremental reconcile
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+
+The nightly reconcile selects transactions with updated_at past its
+high-water mark or an id past the last one seen. Without an index on
+updated_at that OR forced a sequential scan of the whole ledger; with it
+Postgres combines both index ranges in a BitmapOr. Built CONCURRENTLY so
+the ledger stays writable.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transaction_updated_at",
+            "transaction",
+            ["updated_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_transaction_updated_at",
+            table_name="transaction",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
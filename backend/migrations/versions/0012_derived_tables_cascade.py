@@ -0,0 +1,50 @@
+"""cascade deletes into monthly_rollup and entity_version
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+
+Both tables only hold data derived from their owner, but 0003 and 0006
+created their foreign keys without ON DELETE, so deleting an account
+or a user failed while a rollup bucket or version row still pointed at
+it. The keys are recreated with ON DELETE CASCADE; NOT VALID plus a
+separate VALIDATE keeps the write lock short.
+"""
+
+from alembic import op
+
+
+# ── Revision identifiers ──────────────────────────────────
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table and column)
+FOREIGN_KEYS = [
+    ("monthly_rollup", "user_id", '"user" (user_id)'),
+    ("monthly_rollup", "account_id", "account (account_id)"),
+    ("entity_version", "user_id", '"user" (user_id)'),
+]
+
+
+def _recreate(on_delete: str) -> None:
+    for table, column, target in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+                DROP CONSTRAINT IF EXISTS {name},
+                ADD CONSTRAINT {name} FOREIGN KEY ({column})
+                    REFERENCES {target}{on_delete} NOT VALID
+            """
+        )
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def upgrade() -> None:
+    _recreate(" ON DELETE CASCADE")
+
+
+def downgrade() -> None:
+    _recreate("")
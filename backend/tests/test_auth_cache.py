@@ -0,0 +1,58 @@
+# backend/tests/test_auth_cache.py
+import pytest
+from app.core.security import Principal, PrincipalCache
+from app.services.cache import MemoryBackend, NullBackend
+
+pytestmark = pytest.mark.anyio
+
+ALICE = Principal(user_id=1, email="alice@example.com", name="Alice")
+BOB = Principal(user_id=2, email="bob@example.com", name="Bob")
+NEVER = float("inf")
+
+
+async def _cached(cache: PrincipalCache, token: str, principal: Principal) -> None:
+    cache.put(token, principal, NEVER, await cache.marker(principal.user_id))
+
+
+# ── Invalidation reaches every worker ─────────────────────
+async def test_invalidation_reaches_workers_sharing_the_backend():
+    # Two workers with their own LRU over one shared store (redis)
+    shared = MemoryBackend()
+    workers = [PrincipalCache(10, 60, shared), PrincipalCache(10, 60, shared)]
+    for cache in workers:
+        await _cached(cache, "a", ALICE)
+        await _cached(cache, "b", BOB)
+
+    await workers[0].invalidate_user(ALICE.user_id)
+    for cache in workers:
+        assert await cache.get("a") is None
+        assert await cache.get("b") == BOB
+
+
+async def test_entry_cached_after_invalidation_is_served():
+    cache = PrincipalCache(10, 60, MemoryBackend())
+    await cache.invalidate_user(ALICE.user_id)
+    await _cached(cache, "a", ALICE)
+    assert await cache.get("a") == ALICE
+
+
+async def test_load_racing_an_invalidation_is_not_served():
+    cache = PrincipalCache(10, 60, MemoryBackend())
+    marker = await cache.marker(ALICE.user_id)
+    await cache.invalidate_user(ALICE.user_id)  # lands while the user loads
+    cache.put("a", ALICE, NEVER, marker)
+    assert await cache.get("a") is None
+
+
+async def test_without_shared_backend_invalidation_is_local():
+    cache = PrincipalCache(10, 60, NullBackend())
+    await _cached(cache, "a", ALICE)
+    assert await cache.get("a") == ALICE
+    await cache.invalidate_user(ALICE.user_id)
+    assert await cache.get("a") is None
+
+
+async def test_entries_expire_with_the_token():
+    cache = PrincipalCache(10, 60, MemoryBackend())
+    cache.put("a", ALICE, 0.0)
+    assert await cache.get("a") is None
@@ -0,0 +1,103 @@
+# backend/tests/test_balance_concurrency.py
+import asyncio
+import random
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.security import Principal
+from app.models import Account, Transaction
+from app.routers.transactions import (
+    create_transaction,
+    delete_transaction,
+    update_transaction,
+)
+from app.schemas.transactions import TransactionCreate, TransactionUpdate
+from app.services.ledger import SIGNED_AMOUNT
+from tests.conftest import TEST_DATABASE_URL, make_account, make_user, requires_db
+
+pytestmark = [pytest.mark.anyio, requires_db]
+
+CREATES, UPDATED_ROWS, DELETES = 300, 100, 100
+# Far fewer connections than writers, so requests queue on the pool and
+# every open transaction fights over the same two account rows
+POOL_SIZE = 8
+
+
+@pytest.fixture
+async def contended_session(db):
+    engine = create_async_engine(
+        TEST_DATABASE_URL, pool_size=POOL_SIZE, max_overflow=0, pool_timeout=120
+    )
+    yield sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_concurrent_writes_keep_balance_equal_to_ledger(
+    session, contended_session
+):
+    rng = random.Random(5)
+    user = await make_user(session)
+    accounts = [
+        (await make_account(session, user.user_id, balance=100.0)).account_id
+        for _ in range(2)
+    ]
+    current = Principal(user_id=user.user_id, email=user.email, name=user.name)
+
+    # ── Each call gets its own session, like separate requests ─
+    async def create(account_id: int, amount: float, kind: str):
+        payload = TransactionCreate(
+            title="t", description="", amount=amount, type=kind, account_id=account_id
+        )
+        async with contended_session() as s:
+            return await create_transaction(payload, current=current, session=s)
+
+    async def update(tx_id: int, account_id: int, amount: float, kind: str):
+        payload = TransactionUpdate(amount=amount, type=kind, account_id=account_id)
+        async with contended_session() as s:
+            return await update_transaction(tx_id, payload, current=current, session=s)
+
+    async def delete(tx_id: int):
+        async with contended_session() as s:
+            return await delete_transaction(tx_id, current=current, session=s)
+
+    seeded = [
+        await create(rng.choice(accounts), rng.randint(1, 50), "withdrawal")
+        for _ in range(UPDATED_ROWS + DELETES)
+    ]
+    to_update = [t.transaction_id for t in seeded[:UPDATED_ROWS]]
+    to_delete = [t.transaction_id for t in seeded[UPDATED_ROWS:]]
+
+    def kind() -> str:
+        return rng.choice(["deposit", "withdrawal"])
+
+    ops = [
+        create(rng.choice(accounts), rng.randint(1, 50), kind()) for _ in range(CREATES)
+    ]
+    # Every updated row is hit twice, moving between the two accounts, so
+    # writers also race on the same row and lock both accounts at once
+    ops += [
+        update(tx_id, rng.choice(accounts), rng.randint(1, 50), kind())
+        for tx_id in to_update * 2
+    ]
+    ops += [delete(tx_id) for tx_id in to_delete]
+    rng.shuffle(ops)
+    assert len(ops) == 600
+    await asyncio.gather(*ops)
+
+    async with contended_session() as s:
+        count = await s.scalar(
+            select(func.count()).where(Transaction.user_id == user.user_id)
+        )
+        assert count == CREATES + UPDATED_ROWS
+        for account_id in accounts:
+            balance = await s.scalar(
+                select(Account.balance).where(Account.account_id == account_id)
+            )
+            ledger = await s.scalar(
+                select(func.coalesce(func.sum(SIGNED_AMOUNT), 0.0)).where(
+                    Transaction.account_id == account_id
+                )
+            )
+            assert balance == pytest.approx(100.0 + ledger)
@@ -0,0 +1,144 @@
+# backend/tests/test_cache.py
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+from app.core.security import Principal
+from app.db import async_session
+from app.routers.accounts import create_account, read_accounts
+from app.routers.budgets import create_budget, delete_budget
+from app.schemas.account import AccountCreate
+from app.schemas.budget import BudgetCreate
+from app.services.cache import MemoryBackend, NullBackend, ReadCache
+from app.services.versions import (
+    ACCOUNTS,
+    TRANSACTIONS,
+    entity_version,
+    not_modified,
+)
+from tests.conftest import make_user, requires_db
+
+pytestmark = pytest.mark.anyio
+
+
+def _request(etag: str = "") -> Request:
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/accounts",
+            "query_string": b"",
+            "headers": headers,
+        }
+    )
+
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+# ── Backends ──────────────────────────────────────────────
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2)
+    await backend.set("a", "1", 60)
+    await backend.set("b", "2", 60)
+    await backend.get("a")
+    await backend.set("c", "3", 60)
+    assert await backend.get("b") is None
+    assert await backend.get("a") == "1"
+    assert await backend.get("c") == "3"
+
+
+async def test_memory_backend_expires_entries():
+    backend = MemoryBackend()
+    await backend.set("a", "1", -1)
+    assert await backend.get("a") is None
+    assert len(backend._data) == 0
+
+
+# ── Read cache keyed on the entity version ────────────────
+async def test_same_version_is_served_from_cache():
+    cache = ReadCache(MemoryBackend())
+    load = Loader([{"id": 1}])
+    for _ in range(3):
+        assert await cache.get_or_load(1, ACCOUNTS, 4, "", load) == [{"id": 1}]
+    assert load.calls == 1
+    assert cache.stats()["hits"] == {ACCOUNTS: 2}
+
+
+async def test_new_version_reloads_on_every_worker():
+    # Two workers with their own memory: a write elsewhere bumps the
+    # DB version, and neither may keep serving the old list
+    workers = [ReadCache(MemoryBackend()), ReadCache(MemoryBackend())]
+    old, new = Loader(["old"]), Loader(["new"])
+    for cache in workers:
+        assert await cache.get_or_load(1, ACCOUNTS, 1, "", old) == ["old"]
+    for cache in workers:
+        assert await cache.get_or_load(1, ACCOUNTS, 2, "", new) == ["new"]
+    assert new.calls == 2
+
+
+async def test_keys_are_per_user_and_params():
+    cache = ReadCache(MemoryBackend())
+    load = Loader([])
+    await cache.get_or_load(1, ACCOUNTS, 1, "", load)
+    await cache.get_or_load(2, ACCOUNTS, 1, "", load)
+    await cache.get_or_load(1, ACCOUNTS, 1, "page=2", load)
+    assert load.calls == 3
+
+
+async def test_null_backend_always_loads():
+    cache = ReadCache(NullBackend())
+    load = Loader([])
+    await cache.get_or_load(1, ACCOUNTS, 1, "", load)
+    await cache.get_or_load(1, ACCOUNTS, 1, "", load)
+    assert load.calls == 2
+
+
+# ── ETag and cache share the version ──────────────────────
+async def test_etag_changes_with_version():
+    response = Response()
+    assert not_modified(_request(), response, 1, ACCOUNTS, 3) is None
+    etag = response.headers["etag"]
+    assert not_modified(_request(etag), Response(), 1, ACCOUNTS, 3).status_code == 304
+    assert not_modified(_request(etag), Response(), 1, ACCOUNTS, 4) is None
+
+
+@requires_db
+async def test_write_is_visible_to_cached_listing(session):
+    user = await make_user(session)
+    current = Principal(user_id=user.user_id, email=user.email, name=user.name)
+
+    async def listing():
+        async with async_session() as s:
+            return await read_accounts(
+                _request(), Response(), current=current, session=s
+            )
+
+    assert await listing() == []
+    async with async_session() as s:
+        await create_account(AccountCreate(name="Savings"), current=current, session=s)
+    assert [a["name"] for a in await listing()] == ["Savings"]
+
+
+@requires_db
+async def test_budget_delete_bumps_transactions(session):
+    user = await make_user(session)
+    current = Principal(user_id=user.user_id, email=user.email, name=user.name)
+    async with async_session() as s:
+        budget = await create_budget(
+            BudgetCreate(section="fixed", label="Rent", amount=900),
+            current=current,
+            session=s,
+        )
+    before = await entity_version(session, user.user_id, TRANSACTIONS)
+    async with async_session() as s:
+        await delete_budget(budget.budget_id, current=current, session=s)
+    async with async_session() as s:
+        assert await entity_version(s, user.user_id, TRANSACTIONS) == before + 1
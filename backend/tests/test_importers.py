@@ -0,0 +1,33 @@
+# backend/tests/test_importers.py
+import io
+import pytest
+from app.services.importers import ImportFileError, iter_csv_rows
+
+
+def _rows(data: bytes):
+    return iter_csv_rows(io.BytesIO(data))
+
+
+def test_signed_amount_sets_direction():
+    rows = list(_rows(b"title,amount\nRent,-1200\nPay,3000\n"))
+    assert rows == [
+        (2, {"title": "Rent", "amount": 1200.0, "direction": "withdrawal"}),
+        (3, {"title": "Pay", "amount": 3000.0, "direction": "deposit"}),
+    ]
+
+
+def test_bad_encoding_reports_the_line_and_keeps_earlier_rows():
+    rows = _rows(b"title,amount\nCoffee,3\nCaf\xe9,4\n")
+    assert next(rows)[0] == 2
+    with pytest.raises(ImportFileError) as info:
+        next(rows)
+    assert info.value.row == 3
+
+
+def test_malformed_csv_is_an_import_error():
+    # csv rejects fields over its 128 KiB limit
+    rows = _rows(b"title,amount\nfine,1\n" + b"x" * 200_000 + b",2\n")
+    with pytest.raises(ImportFileError) as info:
+        list(rows)
+    assert info.value.row == 3
+    assert info.value.message.startswith("Malformed CSV")
@@ -0,0 +1,104 @@
+# backend/tests/test_query_plans.py
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert, literal, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from app.models import RecurringTransaction, Transaction
+from app.services.recurring import ACTIVE_RULE
+from tests.conftest import make_account, make_user, requires_db
+
+pytestmark = [pytest.mark.anyio, requires_db]
+
+START = datetime(2026, 1, 1)
+
+
+# ── Helpers ───────────────────────────────────────────────
+async def _seed(session, count: int = 2000):
+    users = [await make_user(session, n) for n in ("alice", "bob")]
+    accounts = [await make_account(session, u.user_id) for u in users]
+    rows = [
+        {
+            "user_id": accounts[i % 2].user_id,
+            "account_id": accounts[i % 2].account_id,
+            "title": f"tx {i}",
+            "description": "",
+            "amount": 1.0,
+            "direction": "withdrawal",
+            # Repeat dates so the transaction_id tie-break matters
+            "date": START + timedelta(days=i // 10),
+        }
+        for i in range(count)
+    ]
+    if rows:
+        await session.exec(insert(Transaction), params=rows)
+    await session.commit()
+    await session.exec(text('ANALYZE "transaction"'))
+    return accounts[0]
+
+
+async def _plan(session, stmt) -> str:
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    # Tiny tables would otherwise always seq-scan
+    await session.exec(text("SET LOCAL enable_seqscan = off"))
+    rows = (await session.exec(text(f"EXPLAIN {sql}"))).all()
+    return "\n".join(r[0] for r in rows)
+
+
+def _page(user_id: int):
+    return (
+        select(Transaction)
+        .where(Transaction.user_id == user_id)
+        .order_by(Transaction.date.desc(), Transaction.transaction_id.desc())
+        .limit(11)
+    )
+
+
+# ── GET /transactions hot paths ───────────────────────────
+async def test_first_page_walks_listing_index(session):
+    acct = await _seed(session)
+    plan = await _plan(session, _page(acct.user_id))
+    assert "Index Scan using ix_transaction_user_date_id" in plan, plan
+    assert "Sort" not in plan, plan
+
+
+async def test_cursor_page_seeks_listing_index(session):
+    acct = await _seed(session)
+    stmt = _page(acct.user_id).where(
+        tuple_(Transaction.date, Transaction.transaction_id)
+        < tuple_(literal(START + timedelta(days=50)), literal(500))
+    )
+    plan = await _plan(session, stmt)
+    assert "Index Scan using ix_transaction_user_date_id" in plan, plan
+    assert "Sort" not in plan, plan
+
+
+async def test_account_filter_uses_listing_index(session):
+    acct = await _seed(session)
+    stmt = _page(acct.user_id).where(Transaction.account_id == acct.account_id)
+    plan = await _plan(session, stmt)
+    # Either listing index serves it, depending on the account's share
+    assert "Index Scan using ix_transaction_user_" in plan, plan
+
+
+# ── Recurring scheduler scan ──────────────────────────────
+async def test_due_rule_scan_uses_partial_index(session):
+    await _seed(session, count=0)
+    stmt = select(RecurringTransaction.recurring_id).where(
+        RecurringTransaction.next_run_date <= literal(START), ACTIVE_RULE
+    )
+    plan = await _plan(session, stmt)
+    assert "ix_recurring_transaction_active_next_run" in plan, plan
+
+
+# ── Incremental reconcile scan ────────────────────────────
+async def test_touched_transactions_avoid_seq_scan(session):
+    await _seed(session)
+    stmt = select(Transaction.account_id).where(
+        (Transaction.updated_at > literal(START))
+        | (Transaction.transaction_id > literal(1500))
+    )
+    plan = await _plan(session, stmt)
+    assert "Seq Scan" not in plan, plan
+    assert "ix_transaction_updated_at" in plan, plan
@@ -0,0 +1,40 @@
+# backend/tests/test_read_routing.py
+import pytest
+from app import db
+from app.services.cache import MemoryBackend
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def marks(monkeypatch):
+    backend = MemoryBackend()
+    monkeypatch.setattr(db, "replica_engine", object())
+    monkeypatch.setattr(db, "_write_marks", backend)
+    return backend
+
+
+async def test_write_pins_only_that_user_to_the_primary(marks):
+    assert await db._use_replica(7)
+    await db.note_write(7)
+    assert not await db._use_replica(7)
+    assert await db._use_replica(8)
+
+
+async def test_marker_lives_in_the_shared_backend(marks):
+    # Another worker sharing the backend (redis) sees the same key
+    await db.note_write(7)
+    assert await marks.get(db._write_mark_key(7)) is not None
+
+
+async def test_marker_expires(marks):
+    await db.note_write(7)
+    marks._data[db._write_mark_key(7)] = (0.0, "1")
+    assert await db._use_replica(7)
+
+
+async def test_no_replica_means_no_bookkeeping(monkeypatch):
+    backend = MemoryBackend()
+    monkeypatch.setattr(db, "_write_marks", backend)
+    await db.note_write(7)
+    assert not backend._data
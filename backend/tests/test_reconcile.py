@@ -0,0 +1,49 @@
+# backend/tests/test_reconcile.py
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from app.models import Transaction
+from app.services.reconcile import reconcile_balances
+from tests.conftest import make_account, make_user, requires_db
+
+pytestmark = [pytest.mark.anyio, requires_db]
+
+
+def _tx(user_id: int, account_id: int, tx_id: int, updated_at: datetime) -> dict:
+    return {
+        "transaction_id": tx_id,
+        "user_id": user_id,
+        "account_id": account_id,
+        "title": "t",
+        "description": "",
+        "amount": 10.0,
+        "direction": "deposit",
+        "date": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+async def test_incremental_run_sees_rows_committed_after_the_last_run(session):
+    user = await make_user(session)
+    acct = await make_account(session, user.user_id)
+    now = datetime.utcnow()
+    await session.exec(
+        insert(Transaction),
+        params=[
+            _tx(user.user_id, acct.account_id, 10, now),
+            _tx(user.user_id, acct.account_id, 20, now),
+        ],
+    )
+    await session.commit()
+    first = await reconcile_balances(session, fix=True)
+    assert first.fixed == 1
+
+    # Stamped and id-allocated before that run, committed after it
+    await session.exec(
+        insert(Transaction),
+        params=[_tx(user.user_id, acct.account_id, 15, now - timedelta(seconds=1))],
+    )
+    await session.commit()
+    second = await reconcile_balances(session)
+    assert [d.account_id for d in second.drifted] == [acct.account_id]
+    assert second.drifted[0].expected == pytest.approx(30.0)
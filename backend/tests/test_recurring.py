@@ -0,0 +1,154 @@
+# backend/tests/test_recurring.py
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+from app.core.security import Principal
+from app.db import async_session
+from app.models import Account, RecurringTransaction, Transaction
+from app.routers.recurring import create_recurring, update_recurring
+from app.schemas.recurring import RecurringCreate, RecurringUpdate
+from app.services import recurring
+from app.services.recurring import run_due_recurring
+from tests.conftest import make_account, make_user, requires_db
+
+pytestmark = [pytest.mark.anyio, requires_db]
+
+START = datetime(2026, 1, 1)
+NOW = datetime(2026, 1, 3, 12)
+
+
+def _rule(user_id: int, account_id: int) -> RecurringTransaction:
+    return RecurringTransaction(
+        user_id=user_id,
+        account_id=account_id,
+        amount=10.0,
+        direction="withdrawal",
+        frequency="daily",
+        start_date=START,
+        next_run_date=START,
+    )
+
+
+def _payload(account_id: int) -> RecurringCreate:
+    return RecurringCreate(
+        account_id=account_id,
+        amount=10.0,
+        direction="withdrawal",
+        frequency="daily",
+        start_date=START,
+        next_run_date=START,
+    )
+
+
+# ── Engine never writes into another user's account ───────
+async def test_rule_on_foreign_account_is_skipped(session):
+    alice, bob = [await make_user(session, n) for n in ("alice", "bob")]
+    own = await make_account(session, alice.user_id, balance=100.0)
+    foreign = await make_account(session, bob.user_id, balance=100.0)
+    # Written directly: the API would refuse this rule
+    bad = _rule(alice.user_id, foreign.account_id)
+    good = _rule(alice.user_id, own.account_id)
+    session.add_all([bad, good])
+    await session.commit()
+    bad_id = bad.recurring_id
+
+    async with async_session() as s:
+        report = await run_due_recurring(s, now=NOW)
+    assert (report.rules, report.skipped, report.generated) == (1, 1, 3)
+
+    async with async_session() as s:
+        on_foreign = await s.scalar(
+            select(func.count()).where(Transaction.account_id == foreign.account_id)
+        )
+        balance = await s.scalar(
+            select(Account.balance).where(Account.account_id == foreign.account_id)
+        )
+        skipped = await s.get(RecurringTransaction, bad_id)
+    assert on_foreign == 0
+    assert balance == 100.0
+    # Advanced past the skipped dates, so it is not retried every run
+    assert skipped.next_run_date == START + timedelta(days=3)
+    async with async_session() as s:
+        report = await run_due_recurring(s, now=NOW)
+    assert (report.rules, report.skipped, report.generated) == (0, 0, 0)
+
+
+async def _count(account_id: int) -> int:
+    async with async_session() as s:
+        return await s.scalar(
+            select(func.count()).where(Transaction.account_id == account_id)
+        )
+
+
+# ── Reruns and catch-up ───────────────────────────────────
+async def test_rerun_creates_no_duplicates(session):
+    user = await make_user(session)
+    acct = await make_account(session, user.user_id)
+    rule = _rule(user.user_id, acct.account_id)
+    session.add(rule)
+    await session.commit()
+
+    async with async_session() as s:
+        assert (await run_due_recurring(s, now=NOW)).generated == 3
+    async with async_session() as s:
+        assert (await run_due_recurring(s, now=NOW)).rules == 0
+    # Even a rule rewound to a date it already generated adds nothing
+    async with async_session() as s:
+        await s.exec(
+            update(RecurringTransaction)
+            .where(RecurringTransaction.recurring_id == rule.recurring_id)
+            .values(next_run_date=START)
+        )
+        await s.commit()
+    async with async_session() as s:
+        report = await run_due_recurring(s, now=NOW)
+    assert (report.rules, report.generated) == (1, 0)
+    assert await _count(acct.account_id) == 3
+
+
+async def test_catch_up_is_capped_per_run(session, monkeypatch):
+    monkeypatch.setattr(recurring, "CATCH_UP_LIMIT", 5)
+    user = await make_user(session)
+    acct = await make_account(session, user.user_id)
+    rule = _rule(user.user_id, acct.account_id)
+    session.add(rule)
+    await session.commit()
+    now = START + timedelta(days=11)  # 12 occurrences due
+
+    for generated, next_run in [(5, 5), (5, 10), (2, 12)]:
+        async with async_session() as s:
+            assert (await run_due_recurring(s, now=now)).generated == generated
+        async with async_session() as s:
+            stored = await s.get(RecurringTransaction, rule.recurring_id)
+        assert stored.next_run_date == START + timedelta(days=next_run)
+    assert await _count(acct.account_id) == 12
+
+
+# ── API refuses accounts the caller does not own ──────────
+async def test_create_and_update_reject_foreign_account(session):
+    alice, bob = [await make_user(session, n) for n in ("alice", "bob")]
+    own = await make_account(session, alice.user_id)
+    foreign = await make_account(session, bob.user_id)
+    current = Principal(user_id=alice.user_id, email=alice.email, name=alice.name)
+
+    async with async_session() as s:
+        with pytest.raises(HTTPException) as info:
+            await create_recurring(
+                _payload(foreign.account_id), current=current, session=s
+            )
+    assert info.value.status_code == 400
+
+    async with async_session() as s:
+        rule = await create_recurring(
+            _payload(own.account_id), current=current, session=s
+        )
+    async with async_session() as s:
+        with pytest.raises(HTTPException) as info:
+            await update_recurring(
+                rule.recurring_id,
+                RecurringUpdate(account_id=foreign.account_id),
+                current=current,
+                session=s,
+            )
+    assert info.value.status_code == 400
@@ -0,0 +1,87 @@
+# backend/tests/test_recurring_dates.py
+from datetime import datetime
+from itertools import islice
+from typing import Optional
+from app.models import RecurringTransaction
+from app.services.recurring import add_months, iter_occurrences, merge_occurrences
+
+
+def _rule(
+    rid: int, frequency: str, start: datetime, end: Optional[datetime] = None
+) -> RecurringTransaction:
+    return RecurringTransaction(
+        recurring_id=rid,
+        user_id=1,
+        account_id=1,
+        amount=1.0,
+        direction="withdrawal",
+        frequency=frequency,
+        start_date=start,
+        next_run_date=start,
+        end_date=end,
+    )
+
+
+# ── Month-end clamping ────────────────────────────────────
+def test_add_months_clamps_to_short_months():
+    assert add_months(datetime(2026, 1, 31), 1, 31) == datetime(2026, 2, 28)
+    assert add_months(datetime(2028, 1, 31), 1, 31) == datetime(2028, 2, 29)
+    assert add_months(datetime(2026, 8, 31), 1, 31) == datetime(2026, 9, 30)
+
+
+def test_add_months_returns_to_the_anchor_day():
+    # Feb 28 came from a Jan 31 start: March goes back to the 31st
+    assert add_months(datetime(2026, 2, 28), 1, 31) == datetime(2026, 3, 31)
+    assert add_months(datetime(2026, 12, 31), 2, 31) == datetime(2027, 2, 28)
+
+
+def test_add_months_yearly_from_leap_day():
+    assert add_months(datetime(2028, 2, 29), 12, 29) == datetime(2029, 2, 28)
+    assert add_months(datetime(2029, 2, 28), 36, 29) == datetime(2032, 2, 29)
+
+
+# ── Occurrence windows ────────────────────────────────────
+def test_monthly_rule_keeps_month_end():
+    rule = _rule(1, "monthly", datetime(2026, 1, 31))
+    assert list(islice(iter_occurrences(rule), 4)) == [
+        datetime(2026, 1, 31),
+        datetime(2026, 2, 28),
+        datetime(2026, 3, 31),
+        datetime(2026, 4, 30),
+    ]
+
+
+def test_window_start_skips_earlier_occurrences():
+    rule = _rule(1, "monthly", datetime(2026, 1, 31))
+    assert list(islice(iter_occurrences(rule, datetime(2027, 2, 1)), 2)) == [
+        datetime(2027, 2, 28),
+        datetime(2027, 3, 31),
+    ]
+    weekly = _rule(2, "weekly", datetime(2026, 1, 1))
+    assert next(iter_occurrences(weekly, datetime(2026, 3, 1))) == datetime(2026, 3, 5)
+
+
+def test_occurrences_stop_at_end_date():
+    rule = _rule(1, "yearly", datetime(2028, 2, 29), end=datetime(2032, 2, 29))
+    assert list(iter_occurrences(rule)) == [
+        datetime(2028, 2, 29),
+        datetime(2029, 2, 28),
+        datetime(2030, 2, 28),
+        datetime(2031, 2, 28),
+        datetime(2032, 2, 29),
+    ]
+
+
+# ── Merged calendar ───────────────────────────────────────
+def test_merge_orders_by_date_then_rule():
+    weekly = _rule(2, "weekly", datetime(2026, 1, 1))
+    monthly = _rule(1, "monthly", datetime(2026, 1, 15))
+    window = merge_occurrences(
+        [weekly, monthly], datetime(2026, 1, 10), datetime(2026, 1, 29)
+    )
+    assert [(at.day, rule.recurring_id) for at, rule in window] == [
+        (15, 1),
+        (15, 2),
+        (22, 2),
+        (29, 2),
+    ]
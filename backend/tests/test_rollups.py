@@ -0,0 +1,56 @@
+# backend/tests/test_rollups.py
+import pytest
+from sqlalchemy import func, select
+from app.core.security import Principal
+from app.db import async_session
+from app.models import MonthlyRollup, User
+from app.routers.accounts import create_account, delete_account
+from app.routers.transactions import create_transaction, delete_transaction
+from app.routers.users import delete_me
+from app.schemas.account import AccountCreate
+from app.schemas.transactions import TransactionCreate
+from tests.conftest import make_user, requires_db
+
+pytestmark = [pytest.mark.anyio, requires_db]
+
+
+async def _buckets(user_id: int) -> int:
+    async with async_session() as s:
+        return await s.scalar(
+            select(func.count()).where(MonthlyRollup.user_id == user_id)
+        )
+
+
+# ── Emptied buckets go away, so owners can be deleted ─────
+async def test_account_and_user_delete_after_ledger_is_emptied(session):
+    user = await make_user(session)
+    current = Principal(user_id=user.user_id, email=user.email, name=user.name)
+    async with async_session() as s:
+        acct = await create_account(
+            AccountCreate(name="Cash"), current=current, session=s
+        )
+    async with async_session() as s:
+        tx = await create_transaction(
+            TransactionCreate(
+                title="t",
+                description="",
+                amount=5,
+                type="withdrawal",
+                account_id=acct.account_id,
+            ),
+            current=current,
+            session=s,
+        )
+    assert await _buckets(user.user_id) == 1
+
+    async with async_session() as s:
+        await delete_transaction(tx.transaction_id, current=current, session=s)
+    assert await _buckets(user.user_id) == 0
+
+    async with async_session() as s:
+        await delete_account(acct.account_id, current=current, session=s)
+    # entity_version rows were written by every call above
+    async with async_session() as s:
+        await delete_me(principal=current, session=s)
+    async with async_session() as s:
+        assert await s.get(User, user.user_id) is None
@@ -0,0 +1,118 @@
+# backend/tests/test_scheduler.py
+import asyncio
+import logging
+from datetime import datetime, timedelta
+import pytest
+from app.services import scheduler
+from app.services.scheduler import DueTimer, run_as_leader, scheduler_status
+from tests.conftest import requires_db
+
+pytestmark = pytest.mark.anyio
+
+
+# ── Public status ─────────────────────────────────────────
+@requires_db
+async def test_status_reports_outcome_without_internals(session):
+    assert (await scheduler_status(session, "job")).ok is None
+
+    async def boom() -> int:
+        raise RuntimeError("secret connection string")
+
+    with pytest.raises(RuntimeError):
+        await run_as_leader("job", boom)
+    status = await scheduler_status(session, "job")
+    assert status.ok is False
+    assert status.last_run_at is not None
+    assert "secret" not in status.model_dump_json()
+    assert set(status.model_dump()) == {
+        "job",
+        "last_run_at",
+        "last_duration_ms",
+        "last_rows",
+        "ok",
+    }
+
+
+@requires_db
+async def test_status_reports_rows_generated(session):
+    async def generate() -> int:
+        return 7
+
+    assert await run_as_leader("job", generate) == 7
+    status = await scheduler_status(session, "job")
+    assert (status.ok, status.last_rows) == (True, 7)
+
+
+# ── Lease ─────────────────────────────────────────────────
+@requires_db
+async def test_lease_is_held_during_a_run_and_released_after(db, monkeypatch):
+    async def other_worker_tries() -> int:
+        monkeypatch.setattr(scheduler, "WORKER_ID", "other:1")
+        try:
+            return await run_as_leader("job", generate)
+        finally:
+            monkeypatch.undo()
+
+    async def generate() -> int:
+        return 1
+
+    async def busy() -> int:
+        assert await other_worker_tries() is None
+        return 2
+
+    assert await run_as_leader("job", busy) == 2
+    # A rule edited on another worker fires there without waiting
+    assert await other_worker_tries() == 1
+
+
+# ── Due timer ─────────────────────────────────────────────
+class FlakyLoad:
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.horizons = []
+
+    async def __call__(self, until: datetime):
+        self.horizons.append(until)
+        if len(self.horizons) <= self.failures:
+            raise RuntimeError("database unavailable")
+        return {1: datetime.utcnow()}
+
+
+async def test_timer_retries_failed_reload():
+    load, fired = FlakyLoad(failures=2), asyncio.Event()
+
+    async def fire(keys):
+        fired.set()
+        return {key: None for key in keys}
+
+    timer = DueTimer(fire, load, resync_seconds=60, backoff_seconds=0.01)
+    timer.start()
+    try:
+        await asyncio.wait_for(fired.wait(), 5)
+    finally:
+        await timer.stop()
+    assert len(load.horizons) == 3
+
+
+async def test_timer_loads_only_the_next_window():
+    load = FlakyLoad(failures=0)
+    timer = DueTimer(lambda keys: None, load, resync_seconds=60)
+    before = datetime.utcnow()
+    await timer.rebuild()
+    assert before < load.horizons[0] <= datetime.utcnow() + timedelta(seconds=120)
+
+
+async def test_timer_logs_when_its_task_dies(caplog):
+    timer = DueTimer(lambda keys: None, FlakyLoad(failures=0), resync_seconds=60)
+
+    def broken():
+        raise RuntimeError("bug")
+
+    timer._pop_due = broken
+    with caplog.at_level(logging.ERROR, logger="app.services.scheduler"):
+        timer.start()
+        task = timer._task
+        await asyncio.wait([task], timeout=5)
+        await asyncio.sleep(0)
+    assert "stopped unexpectedly" in caplog.text
+    assert timer._task is None
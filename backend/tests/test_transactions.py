@@ -0,0 +1,85 @@
+# backend/tests/test_transactions.py
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import event, insert
+from starlette.requests import Request
+from starlette.responses import Response
+from app.core.security import Principal
+from app.db import async_session, engine
+from app.models import Transaction
+from app.routers.transactions import list_transactions
+from tests.conftest import make_account, make_user, requires_db
+
+pytestmark = [pytest.mark.anyio, requires_db]
+
+
+def _request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/transactions/",
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+
+async def _list(current: Principal, **params):
+    params = {
+        "page": 1,
+        "page_size": 10,
+        "cursor": None,
+        "include_total": True,
+        "search": None,
+        "start": None,
+        "end": None,
+        "account": None,
+        **params,
+    }
+    async with async_session() as s:
+        return await list_transactions(
+            request=_request(),
+            response=Response(),
+            current=current,
+            session=s,
+            **params,
+        )
+
+
+# ── Cursor pages skip the exact total ─────────────────────
+async def test_cursor_pages_run_no_count(session):
+    user = await make_user(session)
+    acct = await make_account(session, user.user_id)
+    rows = [
+        {
+            "user_id": user.user_id,
+            "account_id": acct.account_id,
+            "title": f"tx {i}",
+            "description": "",
+            "amount": 1.0,
+            "direction": "withdrawal",
+            "date": datetime(2026, 1, 1) + timedelta(days=i),
+        }
+        for i in range(25)
+    ]
+    await session.exec(insert(Transaction), params=rows)
+    await session.commit()
+    current = Principal(user_id=user.user_id, email=user.email, name=user.name)
+
+    first = await _list(current)
+    assert (first.total, first.page) == (25, 1)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.lower())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        second = await _list(current, cursor=first.next_cursor)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+    assert (second.total, second.page) == (None, None)
+    assert len(second.items) == 10
+    assert not any("count(" in sql for sql in statements)
@@ -2,11 +2,8 @@
 import React from 'react'
 import { useQuery } from '@tanstack/react-query'
 import Spinner from '../components/Spinner'
-import { fetchBudgets } from '../services/budgets'
-import { fetchTransactions } from '../services/transactions'
-import { fetchGoals } from '../services/goals'
-import { fetchRecurring } from '../services/recurring'
-import type {BudgetRead, Paged, TransactionRead, GoalRead, RecurringRead } from '../types'
+import { fetchDashboard } from '../services/dashboard'
+import type { BudgetRead, DashboardRead } from '../types'
 import '../styles/global.css'
 import '../styles/dashboard.css'
 
@@ -16,67 +13,22 @@ function capitalize(str: string) {
 }
 
 export default function Dashboard() {
-  // ── Load budgets ───────────────────────────────────
-  const {
-    data: budgets = [],
-    isLoading: bLoad,
-    isError: bErr,
-    error: bErrMsg,
-  } = useQuery<BudgetRead[], Error>({
-    queryKey: ['budgets'],
-    queryFn: fetchBudgets,
-  })
-
-  // ── Load recent transactions ────────────────────────
-  const {
-    data: txPage = { items: [], total: 0, page: 1, page_size: 5 },
-    isLoading: tLoad,
-    isError: tErr,
-    error: tErrMsg,
-  } = useQuery<Paged<TransactionRead>, Error>({
-    queryKey: ['transactions', { page: 1, page_size: 5 }],
-    queryFn: () => fetchTransactions({ page: 1, page_size: 5 }),
-  })
-
-  // ── Load goals ──────────────────────────────────────
-  const {
-    data: goals = [],
-    isLoading: gLoad,
-    isError: gErr,
-    error: gErrMsg,
-  } = useQuery<GoalRead[], Error>({
-    queryKey: ['goals'],
-    queryFn: fetchGoals,
-  })
-
-  // ── Load recurring ──────────────────────────────────
-  const {
-    data: recs = [],
-    isLoading: rLoad,
-    isError: rErr,
-    error: rErrMsg,
-  } = useQuery<RecurringRead[], Error>({
-    queryKey: ['recurring'],
-    queryFn: fetchRecurring,
+  // ── Load everything in one request ───────────────
+  const { data, isLoading, isError, error } = useQuery<DashboardRead, Error>({
+    queryKey: ['dashboard', { recent: 5, upcoming: 5 }],
+    queryFn: () => fetchDashboard({ recent: 5, upcoming: 5 }),
   })
 
   // ── Show spinner or error ──────────────────────────
-  if (bLoad || tLoad || gLoad || rLoad) return <Spinner />
-  if (bErr || tErr || gErr || rErr)
-    return (
-      <p className="error-message">
-        {bErrMsg?.message || tErrMsg?.message || gErrMsg?.message || rErrMsg?.message}
-      </p>
-    )
+  if (isLoading) return <Spinner />
+  if (isError || !data) return <p className="error-message">{error?.message}</p>
+
+  const { budgets, goals, recent_transactions: recentTxs } = data
 
   // ── Compute totals ──────────────────────────────────
-  const totalIncome = budgets
-    .filter(b => b.section === 'income')
-    .reduce((sum, b) => sum + b.amount, 0)
-  const totalExpenses = budgets
-    .filter(b => b.section !== 'income')
-    .reduce((sum, b) => sum + b.amount, 0)
-  const leftover = totalIncome - totalExpenses
+  const totalIncome = data.totals.income
+  const totalExpenses = data.totals.expenses
+  const leftover = data.totals.leftover
 
   // ── Group budgets ───────────────────────────────────
   const incomeB = budgets.filter(b => b.section === 'income')
@@ -95,11 +47,8 @@ export default function Dashboard() {
       )
     })
 
-  // ── Upcoming recurring ──────────────────────────────
-  const upcoming = recs
-    .slice()
-    .sort((a, b) => new Date(a.next_run_date).getTime() - new Date(b.next_run_date).getTime())
-    .slice(0, 5)
+  // ── Upcoming recurring (sorted server-side) ─────────
+  const upcoming = data.upcoming_recurring
 
   return (
     <section className="dashboard-page">
@@ -151,7 +100,7 @@ export default function Dashboard() {
             </tr>
           </thead>
           <tbody>
-            {txPage.items.map(tx => (
+            {recentTxs.map(tx => (
               <tr key={tx.transaction_id}>
                 <td>{capitalize(tx.title)}</td>
                 <td>{new Date(tx.date).toLocaleDateString()}</td>
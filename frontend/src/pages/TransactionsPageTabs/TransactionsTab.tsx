@@ -183,7 +183,7 @@ export default function TransactionsTab(): JSX.Element {
 
   // ── Summary ────────────────────────────────────────
   const showing = txs.items.length
-  const total = txs.total
+  const total = txs.total ?? txs.items.length
   // ── Render ─────────────────────────────────────────
   return (
     <section className="transactions-page">
@@ -1,11 +1,15 @@
 // frontend/src/services/budgets.ts
 import API from './api'
-import type { BudgetRead, BudgetCreate, BudgetUpdate } from '../types.ts'
+import type { BudgetRead, BudgetCreate, BudgetUpdate, BudgetProgress } from '../types.ts'
 
 /* ── Fetch all budgets ───────────────────────────────── */
 export const fetchBudgets = (): Promise<BudgetRead[]> =>
   API.get<BudgetRead[]>('/budgets').then(r => r.data)
 
+/* ── Spent / remaining for the current period ───────── */
+export const fetchBudgetProgress = (): Promise<BudgetProgress[]> =>
+  API.get<BudgetProgress[]>('/budgets/progress').then(r => r.data)
+
 /* ── Create budget ─────────────────────────────── */
 export const createBudget = (b: BudgetCreate): Promise<BudgetRead> =>
   API.post<BudgetRead>('/budgets', b).then(r => r.data)
@@ -0,0 +1,11 @@
+// frontend/src/services/dashboard.ts
+import API from './api'
+import type { DashboardRead } from '../types'
+
+/* ── Fetch whole dashboard in one call ────────────────── */
+export function fetchDashboard(params?: {
+  recent?: number
+  upcoming?: number
+}): Promise<DashboardRead> {
+  return API.get<DashboardRead>('/dashboard', { params }).then(r => r.data)
+}
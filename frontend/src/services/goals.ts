@@ -1,6 +1,14 @@
 //frontend/src/services/goals.ts
 import API from './api'
-import type { GoalRead, GoalCreate, GoalUpdate, GoalDepositRead } from '../types.ts'
+import type {
+  GoalRead,
+  GoalCreate,
+  GoalUpdate,
+  GoalDepositRead,
+  GoalDepositCreate,
+  GoalDepositPage,
+  GoalDepositBulkResult,
+} from '../types.ts'
 
 /* ── Fetch goals ─────────────────────────────────────── */
 export function fetchGoals(): Promise<GoalRead[]> {
@@ -33,4 +41,25 @@ export function addDeposit(
   return API
     .post<GoalDepositRead>(`/goals/${id}/deposits`, { amount })
     .then(r => r.data);
-}
\ No newline at end of file
+}
+
+/* ── Deposit history, oldest first ──────────────────── */
+export function fetchDeposits(
+  id: number,
+  cursor?: string | null,
+  pageSize = 50
+): Promise<GoalDepositPage> {
+  return API.get<GoalDepositPage>(`/goals/${id}/deposits`, {
+    params: { page_size: pageSize, cursor: cursor ?? undefined },
+  }).then(r => r.data)
+}
+
+/* ── Many deposits / withdrawals at once ────────────── */
+export function addDepositsBulk(
+  id: number,
+  items: GoalDepositCreate[]
+): Promise<GoalDepositBulkResult> {
+  return API
+    .post<GoalDepositBulkResult>(`/goals/${id}/deposits/bulk`, { items })
+    .then(r => r.data)
+}
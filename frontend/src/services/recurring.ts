@@ -1,12 +1,27 @@
 // frontend/src/services/recurring.ts
 import API from './api'
-import type { RecurringRead, RecurringCreate, RecurringUpdate } from '../types'
+import type {
+  RecurringRead,
+  RecurringCreate,
+  RecurringUpdate,
+  RecurringOccurrence,
+} from '../types'
 
 /* ── Fetch all recurring transactions ─────────────────── */
 export function fetchRecurring(): Promise<RecurringRead[]> {
   return API.get<RecurringRead[]>('/recurring').then(r => r.data)
 }
 
+/* ── Pending occurrences between two dates (YYYY-MM-DD) ── */
+export function fetchOccurrences(
+  start: string,
+  end: string
+): Promise<RecurringOccurrence[]> {
+  return API.get<RecurringOccurrence[]>('/recurring/occurrences', {
+    params: { start, end },
+  }).then(r => r.data)
+}
+
 /* ── Add recurring transaction ─────────────────── */
 export function createRecurring(r: RecurringCreate): Promise<RecurringRead> {
   return API.post<RecurringRead>('/recurring', r).then(rsp => rsp.data)
@@ -6,6 +6,8 @@ import type { TransactionRead, TransactionCreate, TransactionUpdate, Paged } fro
 export function fetchTransactions(params: {
   page: number
   page_size: number
+  cursor?: string
+  include_total?: boolean
   start?: string
   end?: string
   account?: number
@@ -62,9 +62,10 @@ export interface TransactionUpdate {
 }
 
 export interface Paged<T> {
-  total: number
-  page: number
+  total: number | null
+  page: number | null
   page_size: number
+  next_cursor?: string | null
   items: T[]
 }
 
@@ -108,13 +109,27 @@ export interface RecurringUpdate {
   description?: string
 }
 
+export interface RecurringOccurrence {
+  recurring_id: number
+  date: string
+  account_id: number
+  title?: string
+  amount: number
+  direction: 'withdrawal' | 'deposit'
+}
+
 // ─── Budgets ────────────────────────────────────────
+export type BudgetPeriod = 'weekly' | 'monthly' | 'yearly'
+
 export interface BudgetRead {
   budget_id: number
   user_id: number
   section: 'income' | 'fixed' | 'variable'
   label: string
   amount: number
+  period: BudgetPeriod
+  start_date?: string
+  end_date?: string
   created_at: string
   updated_at: string
 }
@@ -129,6 +144,21 @@ export interface BudgetUpdate {
   section?: 'income' | 'fixed' | 'variable'
   label?: string
   amount?: number
+  period?: BudgetPeriod
+  start_date?: string
+  end_date?: string
+}
+
+export interface BudgetProgress {
+  budget_id: number
+  section: 'income' | 'fixed' | 'variable'
+  label: string
+  period: BudgetPeriod
+  period_start: string
+  period_end: string
+  amount: number
+  spent: number
+  remaining: number
 }
 
 // ─── Goals ──────────────────────────────────────────
@@ -146,6 +176,8 @@ export interface GoalRead extends GoalBase {
   goal_id: number
   user_id: number
   current_amount: number
+  deposit_count: number
+  last_deposit_at?: string
   created_at: string
   updated_at: string
 }
@@ -162,3 +194,35 @@ export interface GoalDepositRead {
   date: string
   note?: string
 }
+
+export interface GoalDepositCreate {
+  amount: number
+  date?: string
+  note?: string
+}
+
+export interface GoalDepositPage {
+  next_cursor?: string | null
+  items: GoalDepositRead[]
+}
+
+export interface GoalDepositBulkResult {
+  inserted: number
+  current_amount: number
+}
+
+// ─── Dashboard ──────────────────────────────────────
+export interface DashboardTotals {
+  income: number
+  expenses: number
+  leftover: number
+  balance: number
+}
+
+export interface DashboardRead {
+  totals: DashboardTotals
+  budgets: BudgetRead[]
+  recent_transactions: TransactionRead[]
+  goals: GoalRead[]
+  upcoming_recurring: RecurringRead[]
+}